@@ -0,0 +1 @@
+# ADK web server agent packages
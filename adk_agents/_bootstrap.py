@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""
+Shared Bootstrap for ADK Web Server Agents
+Sets the Vertex AI environment and resolves the project once per process.
+"""
+
+import functools
+import logging
+import os
+
+from utils.project_id import get_project_id
+
+logger = logging.getLogger(__name__)
+
+LOCATION = "us-central1"
+
+# Set up Vertex AI environment variables
+os.environ["GOOGLE_GENAI_USE_VERTEXAI"] = "true"
+os.environ["GOOGLE_CLOUD_LOCATION"] = LOCATION
+
+# Get project info from environment or gcloud config
+PROJECT_ID = get_project_id()
+if not PROJECT_ID:
+    PROJECT_ID = "your-project-id"
+    logger.warning("⚠️  Could not determine project ID. Using placeholder.")
+
+
+@functools.lru_cache(maxsize=1)
+def init_vertex() -> None:
+    """Initialize Vertex AI once per process, however many agent modules load."""
+    import vertexai
+
+    try:
+        vertexai.init(project=PROJECT_ID, location=LOCATION)
+        logger.debug("✅ Vertex AI initialized for project: %s", PROJECT_ID)
+    except Exception as e:
+        logger.warning("⚠️  Vertex AI initialization warning: %s", e)
@@ -3,21 +3,13 @@
 Emergency Resource Finder & Crisis Navigator Agent for ADK Web Server
 """
 
-import os
-import sys
+import logging
 
-# Add parent directories to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+# The sibling module initializes Vertex AI and builds the root agent
+from .root_agent import root_agent
 
-# Set up Vertex AI environment variables
-os.environ["GOOGLE_GENAI_USE_VERTEXAI"] = "true"
-os.environ["GOOGLE_CLOUD_LOCATION"] = "us-central1"
+logger = logging.getLogger(__name__)
 
-import vertexai
-
-# Import the root agent
-from root_agent import root_agent
-
-print(f"✅ Emergency Resource Finder & Crisis Navigator Agent loaded for ADK web server")
-print(f"🚨 Agent: {root_agent.name}")
-print(f"📋 Description: {root_agent.description}")
+logger.debug("✅ Emergency Resource Finder & Crisis Navigator Agent loaded for ADK web server")
+logger.debug("🚨 Agent: %s", root_agent.name)
+logger.debug("📋 Description: %s", root_agent.description)
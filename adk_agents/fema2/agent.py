@@ -3,54 +3,23 @@
 USDA BigQuery Agent for ADK Web Server
 """
 
-import os
-import sys
+import logging
 
-# Add parent directories to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
-
-# Set up Vertex AI environment variables
-os.environ["GOOGLE_GENAI_USE_VERTEXAI"] = "true"
-os.environ["GOOGLE_CLOUD_LOCATION"] = "us-central1"
-
-import vertexai
+from adk_agents._bootstrap import PROJECT_ID, init_vertex
 from agents.fema2_agent import create_emergency_crisis_bigquery_agent
 
+logger = logging.getLogger(__name__)
 
-# Get project info from environment
-project_id = os.environ.get('GOOGLE_CLOUD_PROJECT')
-if not project_id:
-    # Try to get from gcloud
-    import subprocess
-    try:
-        result = subprocess.run(
-            ['gcloud', 'config', 'get-value', 'project'],
-            capture_output=True, text=True
-        )
-        if result.returncode == 0 and result.stdout.strip() != "(unset)":
-            project_id = result.stdout.strip()
-    except:
-        pass
-
-if not project_id:
-    project_id = "your-project-id"
-    print("⚠️  Could not determine project ID. Using placeholder.")
-
-dataset_name = f"{project_id}.B2AgentsForImpact"
+dataset_name = f"{PROJECT_ID}.B2AgentsForImpact"
 
-# Initialize Vertex AI
-try:
-    vertexai.init(project=project_id, location="us-central1")
-    print(f"✅ Vertex AI initialized for project: {project_id}")
-except Exception as e:
-    print(f"⚠️  Vertex AI initialization warning: {e}")
+init_vertex()
 
 # Create the root_agent instance - this is what ADK web server expects
 root_agent = create_emergency_crisis_bigquery_agent(
-    project_id=project_id,
+    project_id=PROJECT_ID,
     dataset_name=dataset_name
 )
 
-print(f"✅ A BigQuery Agent loaded for ADK web server")
-print(f"📊 Project: {project_id}")
-print(f"🗄️  Dataset: {dataset_name}")
+logger.debug("✅ A BigQuery Agent loaded for ADK web server")
+logger.debug("📊 Project: %s", PROJECT_ID)
+logger.debug("🗄️  Dataset: %s", dataset_name)
@@ -4,41 +4,23 @@ Root Agent for USDA BigQuery Agent
 Required by ADK web server.
 """
 
-import os
-import sys
-
-# Add parent directories to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+import logging
 
+from adk_agents._bootstrap import PROJECT_ID, init_vertex
 from agents.fema2_agent import create_emergency_crisis_bigquery_agent
 
-# Get project info from environment
-project_id = os.environ.get('GOOGLE_CLOUD_PROJECT')
-if not project_id:
-    # Try to get from gcloud
-    import subprocess
-    try:
-        result = subprocess.run(
-            ['gcloud', 'config', 'get-value', 'project'],
-            capture_output=True, text=True
-        )
-        if result.returncode == 0 and result.stdout.strip() != "(unset)":
-            project_id = result.stdout.strip()
-    except:
-        pass
+logger = logging.getLogger(__name__)
 
-if not project_id:
-    project_id = "your-project-id"
-    print("⚠️  Could not determine project ID. Using placeholder.")
+dataset_name = f"{PROJECT_ID}.B2AgentsForImpact"
 
-dataset_name = f"{project_id}.B2AgentsForImpact"
+init_vertex()
 
 # Create the root agent instance - this is what ADK web server expects
 root_agent = create_emergency_crisis_bigquery_agent(
-    project_id=project_id,
+    project_id=PROJECT_ID,
     dataset_name=dataset_name
 )
 
-print(f"✅ Root agent loaded: {root_agent.name}")
-print(f"📊 Project: {project_id}")
-print(f"🗄️  Dataset: {dataset_name}")
+logger.debug("✅ Root agent loaded: %s", root_agent.name)
+logger.debug("📊 Project: %s", PROJECT_ID)
+logger.debug("🗄️  Dataset: %s", dataset_name)
@@ -0,0 +1 @@
+# Emergency Resource Finder & Crisis Navigator agents
@@ -4,39 +4,22 @@ Data Agent for Emergency Resource Finder & Crisis Navigator
 Queries BigQuery for emergency resources like shelters, hospitals, and food centers.
 """
 
+import functools
+import sys
+from typing import Optional
+
 from google.cloud import bigquery
 from google.adk.agents import Agent
-from google.adk.tools.bigquery import BigQueryCredentialsConfig, BigQueryToolset
-from google.adk.tools.bigquery.config import BigQueryToolConfig, WriteMode
 from google.genai import types
-import google.auth
 import json
 
+from google.adk.tools.bigquery import BigQueryToolset
+from google.auth.credentials import Credentials
 
-def create_data_agent(project_id: str, dataset_name: str, model: str = "gemini-2.5-flash") -> Agent:
-    """
-    Create a Data Agent for querying emergency resource data from BigQuery.
-    
-    Args:
-        project_id: Google Cloud project ID
-        dataset_name: BigQuery dataset name containing emergency resource data
-        model: Gemini model to use
-        
-    Returns:
-        Configured Agent for BigQuery data queries
-    """
-    # Setup BigQuery tools
-    credentials, _ = google.auth.default()
-    bq_credentials = BigQueryCredentialsConfig(credentials=credentials)
-    bq_tool_cfg = BigQueryToolConfig(write_mode=WriteMode.BLOCKED)  # Read-only
-    
-    bq_tools = BigQueryToolset(
-        credentials_config=bq_credentials,
-        bigquery_tool_config=bq_tool_cfg
-    )
-    
-    # Agent instructions for emergency resource data queries
-    instructions = f"""
+from utils.credentials import get_bigquery_toolset
+
+# Agent instructions for emergency resource data queries
+_DATA_AGENT_INSTRUCTIONS_TMPL = """
     You are the Data Agent for the Emergency Resource Finder & Crisis Navigator system.
     
     Your role is to query BigQuery datasets containing emergency resource information and return structured data.
@@ -62,6 +45,38 @@ def create_data_agent(project_id: str, dataset_name: str, model: str = "gemini-2
     
     Be precise with SQL queries and handle location-based searches efficiently.
     """
+
+
+@functools.lru_cache(maxsize=16)
+def _render_instructions(dataset_name: str) -> str:
+    """Format the instruction template once per dataset."""
+    return sys.intern(_DATA_AGENT_INSTRUCTIONS_TMPL.format(dataset_name=dataset_name))
+
+
+def create_data_agent(project_id: str, dataset_name: str, model: str = "gemini-2.5-flash",
+                      bq_tools: Optional[BigQueryToolset] = None,
+                      credentials: Optional[Credentials] = None) -> Agent:
+    """
+    Create a Data Agent for querying emergency resource data from BigQuery.
+    
+    Args:
+        project_id: Google Cloud project ID
+        dataset_name: BigQuery dataset name containing emergency resource data
+        model: Gemini model to use
+        bq_tools: Pre-built BigQuery toolset to reuse (defaults to the shared read-only toolset)
+        credentials: Credentials for the default toolset (defaults to the cached ADC)
+        
+    Returns:
+        Configured Agent for BigQuery data queries. A new Agent is built on every
+        call (an ADK agent can only have one parent); the toolset and rendered
+        instructions it is built from are cached.
+    """
+    # Setup BigQuery tools (read-only, shared across agents)
+    if bq_tools is None:
+        bq_tools = get_bigquery_toolset(project_id, credentials=credentials)
+    
+    # Agent instructions for emergency resource data queries
+    instructions = _render_instructions(dataset_name)
     
     return Agent(
         model=model,
@@ -4,34 +4,240 @@ BigQuery Agent - A flexible Python class for accessing and querying BigQuery dat
 Enhanced with ADK integration for agent-based workflows.
 """
 
-from google.cloud import bigquery
-from typing import Optional, List, Dict, Any
-import pandas as pd
+from __future__ import annotations
 
-# ADK imports for agent integration
-from google.adk.agents import Agent
-from google.adk.tools.bigquery import BigQueryCredentialsConfig, BigQueryToolset
-from google.adk.tools.bigquery.config import BigQueryToolConfig, WriteMode
-from google.genai import types
-import google.auth
+import functools
+import hashlib
+import io
+import operator
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from threading import RLock
+from typing import TYPE_CHECKING, Optional, List, Dict, Any
+
+from cachetools import TTLCache, cached
+
+# pandas, google.cloud.bigquery(_storage) and ADK are imported where used so
+# that importing this module (e.g. from app.py under `adk web`) stays cheap.
+if TYPE_CHECKING:
+    from google.adk.agents import Agent
 
 PROJECT_ID = "qwiklabs-gcp-01-2a76b8f0c7a6" # @param {type:"string"}
 DATASET_NAME = "qwiklabs-gcp-01-2a76b8f0c7a6.B2AgentsForImpact"
 
+# (name, type, mode) of a SchemaField, fetched in one C-level call per field
+_SCHEMA_KEYS = ('name', 'type', 'mode')
+_schema_getter = operator.attrgetter('name', 'field_type', 'mode')
+
 class BigQueryAgent:
     """
     A flexible agent for interacting with BigQuery datasets and tables.
     """
 
-    def __init__(self, project_id: Optional[str] = None):
+    def __init__(self, project_id: Optional[str] = None, max_workers: int = 32,
+                 pool_size: Optional[int] = None):
         """
         Initialize the BigQuery agent.
 
         Args:
             project_id (str, optional): GCP project ID. If None, uses default credentials.
+            max_workers (int): Threads used to fan out independent metadata requests.
+                The pool is shared by every instance created with the same size.
+            pool_size (int, optional): HTTP connections kept per host by the BigQuery
+                client. Defaults to max_workers so fanned-out requests don't queue.
+                Only applies when this call creates the project's shared client.
         """
-        self.client = bigquery.Client(project=project_id) if project_id else bigquery.Client()
+        self.client = self._get_client(project_id, pool_size or max_workers)
         self.project_id = project_id or self.client.project
+        self._executor = self._get_executor(max_workers)
+
+        # DataFrame results keyed by SQL digest, bounded by total in-memory size
+        self._query_cache = TTLCache(
+            maxsize=self._QUERY_CACHE_MAX_BYTES,
+            ttl=600,
+            getsizeof=lambda df: max(int(df.memory_usage(deep=True).sum()), 1),
+        )
+        self._query_cache_lock = RLock()
+
+    _QUERY_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+    # One BigQuery client per project, shared by every BigQueryAgent instance
+    _client_registry: Dict[str, Any] = {}
+    _registry_lock = RLock()
+
+    @classmethod
+    def _get_client(cls, project_id: Optional[str], pool_size: int):
+        """Get the shared client for a project, creating it on first use."""
+        key = project_id or "__default__"
+        with cls._registry_lock:
+            client = cls._client_registry.get(key)
+            if client is None:
+                from google.cloud import bigquery
+                from requests.adapters import HTTPAdapter
+
+                client = bigquery.Client(project=project_id) if project_id else bigquery.Client()
+                # requests' default pool holds 10 connections per host; size it to the executor
+                client._http.mount(
+                    "https://", HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+                )
+                cls._client_registry[key] = client
+            return client
+
+    # Metadata thread pools keyed by size, shared (like the clients) by every instance
+    _executor_registry: Dict[int, ThreadPoolExecutor] = {}
+
+    @classmethod
+    def _get_executor(cls, max_workers: int) -> ThreadPoolExecutor:
+        """Get the shared metadata thread pool of a given size, creating it on first use."""
+        with cls._registry_lock:
+            executor = cls._executor_registry.get(max_workers)
+            if executor is None:
+                executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="bq-metadata")
+                cls._executor_registry[max_workers] = executor
+            return executor
+
+    # Metadata lookups are shared across instances and keyed by
+    # (project, dataset[, table]) so cross-project calls don't collide.
+    # Only successful lookups are cached; errors are retried on the next call.
+    _dataset_cache = TTLCache(maxsize=1024, ttl=300)
+    _dataset_cache_lock = RLock()
+    _table_cache = TTLCache(maxsize=4096, ttl=300)
+    _table_cache_lock = RLock()
+    _list_tables_cache = TTLCache(maxsize=1024, ttl=60)
+    _list_tables_cache_lock = RLock()
+    _list_datasets_cache = TTLCache(maxsize=64, ttl=60)
+    _list_datasets_cache_lock = RLock()
+    _tables_bulk_cache = TTLCache(maxsize=1024, ttl=60)
+    _tables_bulk_cache_lock = RLock()
+
+    _MAX_PAGE_SIZE = 1000
+
+    def _iter_paged(self, list_method, *args, page_size: int = 50,
+                    max_items: Optional[int] = None, **kwargs):
+        """
+        Yield items from a paged list call, stopping as soon as max_items are seen.
+
+        The first page holds at most min(page_size, max_items) items and each
+        following page doubles in size, so small caps cost a single request
+        while full listings still need only a few round trips.
+        """
+        if max_items is not None:
+            if max_items <= 0:
+                return
+            page_size = min(page_size, max_items)
+        page_token = None
+        yielded = 0
+        while True:
+            iterator = list_method(*args, page_size=page_size, page_token=page_token, **kwargs)
+            page = next(iterator.pages, None)
+            if page is None:
+                return
+            for item in page:
+                yield item
+                yielded += 1
+                if max_items is not None and yielded >= max_items:
+                    return
+            page_token = iterator.next_page_token
+            if not page_token:
+                return
+            page_size = min(page_size * 2, self._MAX_PAGE_SIZE)
+
+    def _iter_datasets(self, project: str, page_size: int = 50, max_items: Optional[int] = None):
+        """Yield dataset IDs in a project, fetching only as many pages as needed."""
+        for dataset in self._iter_paged(self.client.list_datasets, project=project,
+                                        page_size=page_size, max_items=max_items):
+            yield dataset.dataset_id
+
+    def _iter_tables(self, project: str, dataset_id: str, page_size: int = 50,
+                     max_items: Optional[int] = None):
+        """Yield table IDs in a dataset, fetching only as many pages as needed."""
+        dataset_ref = self.client.dataset(dataset_id, project=project)
+        for table in self._iter_paged(self.client.list_tables, dataset_ref,
+                                      page_size=page_size, max_items=max_items):
+            yield table.table_id
+
+    @cached(_list_datasets_cache, key=lambda self, project: project, lock=_list_datasets_cache_lock)
+    def _list_datasets_cached(self, project: str) -> Dict[str, Optional[str]]:
+        """Map each dataset ID in a project to its lowercase location, in listing order."""
+        # datasets.list already returns every dataset's location; DatasetListItem
+        # only exposes it through the raw API resource
+        return {
+            dataset.dataset_id: (dataset._properties.get('location') or '').lower() or None
+            for dataset in self._iter_paged(self.client.list_datasets, project=project)
+        }
+
+    @cached(_dataset_cache, key=lambda self, project, dataset_id: (project, dataset_id),
+            lock=_dataset_cache_lock)
+    def _get_dataset_info_cached(self, project: str, dataset_id: str) -> Dict[str, Any]:
+        dataset_ref = self.client.dataset(dataset_id, project=project)
+        dataset = self.client.get_dataset(dataset_ref)
+
+        return {
+            'dataset_id': dataset.dataset_id,
+            'project': dataset.project,
+            'description': dataset.description,
+            'created': dataset.created,
+            'modified': dataset.modified,
+            'location': dataset.location
+        }
+
+    @cached(_list_tables_cache, key=lambda self, project, dataset_id: (project, dataset_id),
+            lock=_list_tables_cache_lock)
+    def _list_tables_cached(self, project: str, dataset_id: str) -> List[str]:
+        return list(self._iter_tables(project, dataset_id))
+
+    @cached(_table_cache, key=lambda self, project, dataset_id, table_id: (project, dataset_id, table_id),
+            lock=_table_cache_lock)
+    def _get_table_info_cached(self, project: str, dataset_id: str, table_id: str) -> Dict[str, Any]:
+        table = self.client.get_table(f"{project}.{dataset_id}.{table_id}")
+
+        return {
+            'table_id': table.table_id,
+            'dataset_id': table.dataset_id,
+            'project': table.project,
+            'table_type': table.table_type,
+            'num_rows': table.num_rows,
+            'num_bytes': table.num_bytes,
+            'created': table.created,
+            'modified': table.modified,
+            'schema': [dict(zip(_SCHEMA_KEYS, _schema_getter(field))) for field in table.schema]
+        }
+
+    @cached(_tables_bulk_cache, key=lambda self, project, dataset_id: (project, dataset_id),
+            lock=_tables_bulk_cache_lock)
+    def _list_tables_bulk_cached(self, project: str, dataset_id: str) -> Dict[str, Dict[str, Any]]:
+        sql = f"""
+            SELECT
+              table_id,
+              row_count,
+              size_bytes,
+              TIMESTAMP_MILLIS(creation_time) AS created,
+              TIMESTAMP_MILLIS(last_modified_time) AS modified
+            FROM `{project}.{dataset_id}.__TABLES__`
+            ORDER BY table_id
+        """
+        return {
+            row['table_id']: {
+                'table_id': row['table_id'],
+                'dataset_id': dataset_id,
+                'project': project,
+                'num_rows': row['row_count'],
+                'num_bytes': row['size_bytes'],
+                'created': row['created'],
+                'modified': row['modified'],
+            }
+            for row in self.client.query(sql).result()
+        }
+
+    @functools.cached_property
+    def _bqstorage_client(self) -> Optional[Any]:
+        """BigQuery Storage Read client for Arrow downloads, created on first use."""
+        # The Storage Read API is optional; without it results download over REST
+        try:
+            from google.cloud import bigquery_storage
+        except ImportError:
+            return None
+        return bigquery_storage.BigQueryReadClient(credentials=self.client._credentials)
 
     def list_datasets(self, project_id: Optional[str] = None) -> List[str]:
         """
@@ -45,8 +251,7 @@ class BigQueryAgent:
         """
         target_project = project_id or self.project_id
         try:
-            datasets = list(self.client.list_datasets(project=target_project))
-            return [dataset.dataset_id for dataset in datasets]
+            return list(self._list_datasets_cached(target_project))
         except Exception as e:
             print(f"Error listing datasets: {e}")
             return []
@@ -64,17 +269,7 @@ class BigQueryAgent:
         """
         target_project = project_id or self.project_id
         try:
-            dataset_ref = self.client.dataset(dataset_id, project=target_project)
-            dataset = self.client.get_dataset(dataset_ref)
-
-            return {
-                'dataset_id': dataset.dataset_id,
-                'project': dataset.project,
-                'description': dataset.description,
-                'created': dataset.created,
-                'modified': dataset.modified,
-                'location': dataset.location
-            }
+            return dict(self._get_dataset_info_cached(target_project, dataset_id))
         except Exception as e:
             print(f"Error accessing dataset {dataset_id}: {e}")
             return None
@@ -92,9 +287,7 @@ class BigQueryAgent:
         """
         target_project = project_id or self.project_id
         try:
-            dataset_ref = self.client.dataset(dataset_id, project=target_project)
-            tables = list(self.client.list_tables(dataset_ref))
-            return [table.table_id for table in tables]
+            return list(self._list_tables_cached(target_project, dataset_id))
         except Exception as e:
             print(f"Error listing tables in dataset {dataset_id}: {e}")
             return []
@@ -113,41 +306,106 @@ class BigQueryAgent:
         """
         target_project = project_id or self.project_id
         try:
-            full_table_id = f"{target_project}.{dataset_id}.{table_id}"
-            table = self.client.get_table(full_table_id)
-
-            return {
-                'table_id': table.table_id,
-                'dataset_id': table.dataset_id,
-                'project': table.project,
-                'num_rows': table.num_rows,
-                'num_bytes': table.num_bytes,
-                'created': table.created,
-                'modified': table.modified,
-                'schema': [{'name': field.name, 'type': field.field_type, 'mode': field.mode}
-                          for field in table.schema]
-            }
+            return dict(self._get_table_info_cached(target_project, dataset_id, table_id))
         except Exception as e:
             print(f"Error accessing table {table_id}: {e}")
             return None
 
-    def query(self, sql: str, to_dataframe: bool = True) -> Optional[Any]:
+    def list_tables_bulk(self, dataset_id: str, project_id: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Get row counts, sizes and timestamps for every table in a dataset with one query.
+
+        Reads the dataset's `__TABLES__` metadata view instead of calling
+        get_table() once per table. The result has no schema; use
+        get_table_info() for that.
+
+        Args:
+            dataset_id (str): Dataset ID
+            project_id (str, optional): Project ID. Uses default if None.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Table summaries keyed by table ID (empty if error)
+        """
+        target_project = project_id or self.project_id
+        try:
+            return dict(self._list_tables_bulk_cached(target_project, dataset_id))
+        except Exception as e:
+            print(f"Error listing tables in dataset {dataset_id}: {e}")
+            return {}
+
+    _RETURN_FORMATS = (None, "pandas", "arrow", "polars")
+
+    def _rows_to_columnar(self, rows, return_format: str) -> Any:
+        """Convert a RowIterator to a pyarrow Table or polars DataFrame, skipping pandas."""
+        # Read through the Storage Read API (Arrow) when available
+        table = rows.to_arrow(bqstorage_client=self._bqstorage_client, create_bqstorage_client=False)
+        if return_format == "polars":
+            import polars as pl
+
+            return pl.from_arrow(table)
+        return table
+
+    def query(self, sql: str, to_dataframe: bool = True, use_cache: bool = False,
+              dry_run: bool = False, return_format: Optional[str] = None) -> Optional[Any]:
         """
         Execute a SQL query.
 
+        With use_cache=True, DataFrame results are kept client-side for 10 minutes,
+        keyed by a digest of the SQL, so repeating an identical query skips the job
+        round trip and download. Only opt in for deterministic SQL over tables that
+        don't change meanwhile; BigQuery's own result cache already applies otherwise.
+
         Args:
             sql (str): SQL query string
             to_dataframe (bool): If True, return pandas DataFrame. If False, return query results.
+            use_cache (bool): If True, serve/store the DataFrame in the client-side cache.
+            dry_run (bool): If True, only validate the query and return the bytes it would process.
+            return_format (str, optional): "arrow" or "polars" to return a pyarrow Table or
+                polars DataFrame without building a pandas DataFrame (not cached).
+                "pandas"/None keeps the to_dataframe behavior.
 
         Returns:
-            pandas.DataFrame or QueryJob results, or None if error
+            pandas.DataFrame, pyarrow.Table, polars.DataFrame, QueryJob results, or
+            estimated bytes for a dry run; None if error
         """
+        if return_format not in self._RETURN_FORMATS:
+            raise ValueError(f"return_format must be one of {self._RETURN_FORMATS}, got {return_format!r}")
+
         try:
+            if dry_run:
+                from google.cloud import bigquery
+
+                job_config = bigquery.QueryJobConfig(dry_run=True, use_query_cache=False)
+                return self.client.query(sql, job_config=job_config).total_bytes_processed
+
+            if return_format in ("arrow", "polars"):
+                return self._rows_to_columnar(self.client.query(sql).result(), return_format)
+
+            key = hashlib.blake2b(sql.encode(), digest_size=16).digest()
+            if to_dataframe and use_cache:
+                with self._query_cache_lock:
+                    cached_df = self._query_cache.get(key)
+                if cached_df is not None:
+                    # Deep copy so callers can't mutate the cached frame in place
+                    return cached_df.copy(deep=True)
+
             query_job = self.client.query(sql)
             results = query_job.result()
 
             if to_dataframe:
-                return results.to_dataframe()
+                # Download through the Storage Read API (Arrow) when available
+                df = results.to_dataframe(
+                    bqstorage_client=self._bqstorage_client,
+                    create_bqstorage_client=False,
+                )
+                if use_cache:
+                    with self._query_cache_lock:
+                        try:
+                            self._query_cache[key] = df
+                        except ValueError:
+                            pass  # Larger than the whole cache; don't keep it
+                    return df.copy(deep=True)
+                return df
             else:
                 return results
         except Exception as e:
@@ -155,7 +413,8 @@ class BigQueryAgent:
             return None
 
     def sample_table(self, dataset_id: str, table_id: str, limit: int = 10,
-                    project_id: Optional[str] = None) -> Optional[pd.DataFrame]:
+                    project_id: Optional[str] = None,
+                    return_format: Optional[str] = None) -> Optional[Any]:
         """
         Get a sample of rows from a table.
 
@@ -164,13 +423,30 @@ class BigQueryAgent:
             table_id (str): Table ID
             limit (int): Number of rows to sample
             project_id (str, optional): Project ID. Uses default if None.
+            return_format (str, optional): "arrow" or "polars" to skip building a pandas DataFrame
 
         Returns:
-            pandas.DataFrame: Sample data or None if error
+            pandas.DataFrame (or pyarrow.Table / polars.DataFrame): Sample data or None if error
         """
+        if return_format not in self._RETURN_FORMATS:
+            raise ValueError(f"return_format must be one of {self._RETURN_FORMATS}, got {return_format!r}")
+
         target_project = project_id or self.project_id
-        sql = f"SELECT * FROM `{target_project}.{dataset_id}.{table_id}` LIMIT {limit}"
-        return self.query(sql)
+        table_ref = f"{target_project}.{dataset_id}.{table_id}"
+        try:
+            table_type = self._get_table_info_cached(target_project, dataset_id, table_id)['table_type']
+            if table_type == "TABLE":
+                # tabledata.list reads rows directly: no query job, no bytes billed
+                rows = self.client.list_rows(table_ref, max_results=limit)
+                if return_format in ("arrow", "polars"):
+                    return self._rows_to_columnar(rows, return_format)
+                return rows.to_dataframe()
+        except Exception as e:
+            print(f"Error sampling table {table_id}: {e}")
+            return None
+
+        # Views, materialized views and external tables can't be read with tabledata.list
+        return self.query(f"SELECT * FROM `{table_ref}` LIMIT {int(limit)}", return_format=return_format)
 
     def explore_dataset(self, dataset_id: str, project_id: Optional[str] = None) -> None:
         """
@@ -187,21 +463,25 @@ class BigQueryAgent:
         if not dataset_info:
             return
 
-        print(f"Dataset: {dataset_info['dataset_id']}")
-        print(f"Project: {dataset_info['project']}")
-        print(f"Description: {dataset_info['description']}")
-        print(f"Location: {dataset_info['location']}")
-        print(f"Created: {dataset_info['created']}")
-        print("-" * 50)
+        # Build the report in memory and write it to stdout in one call
+        buf = io.StringIO()
+        out = functools.partial(print, file=buf)
+
+        out(f"Dataset: {dataset_info['dataset_id']}")
+        out(f"Project: {dataset_info['project']}")
+        out(f"Description: {dataset_info['description']}")
+        out(f"Location: {dataset_info['location']}")
+        out(f"Created: {dataset_info['created']}")
+        out("-" * 50)
 
-        # List tables
-        tables = self.list_tables(dataset_id, target_project)
-        print(f"\nTables ({len(tables)}):")
+        # List tables with row counts and sizes in a single metadata query
+        tables = self.list_tables_bulk(dataset_id, target_project)
+        out(f"\nTables ({len(tables)}):")
 
-        for table_id in tables:
-            table_info = self.get_table_info(dataset_id, table_id, target_project)
-            if table_info:
-                print(f"  - {table_id}: {table_info['num_rows']:,} rows, {table_info['num_bytes']:,} bytes")
+        for table_id, table_info in tables.items():
+            out(f"  - {table_id}: {table_info['num_rows']:,} rows, {table_info['num_bytes']:,} bytes")
+
+        sys.stdout.write(buf.getvalue())
 
     def explore_all_datasets(self, project_id: Optional[str] = None, max_datasets: int = 10) -> None:
         """
@@ -213,97 +493,287 @@ class BigQueryAgent:
         """
         target_project = project_id or self.project_id
 
-        print(f"Exploring all datasets in project: {target_project}")
-        print("=" * 60)
-
-        datasets = self.list_datasets(target_project)
-        if not datasets:
-            print("No datasets found or access denied.")
-            return
-
-        print(f"Found {len(datasets)} datasets:")
-        for i, dataset_id in enumerate(datasets[:max_datasets]):
-            print(f"\n[{i+1}/{len(datasets)}] {dataset_id}")
-            print("-" * 40)
-
-            dataset_info = self.get_dataset_info(dataset_id, target_project)
-            if dataset_info:
-                print(f"Description: {dataset_info['description'] or 'No description'}")
-                print(f"Location: {dataset_info['location']}")
-
-                # List tables with basic info
-                tables = self.list_tables(dataset_id, target_project)
-                if tables:
-                    print(f"Tables ({len(tables)}):")
-                    for table_id in tables[:5]:  # Show first 5 tables
-                        table_info = self.get_table_info(dataset_id, table_id, target_project)
-                        if table_info:
+        # Build the report in memory and write it to stdout in one call
+        buf = io.StringIO()
+        out = functools.partial(print, file=buf)
+        try:
+            out(f"Exploring all datasets in project: {target_project}")
+            out("=" * 60)
+
+            # Fetch one dataset past the cap so we know whether more exist,
+            # without paging through the whole project
+            try:
+                datasets = list(self._iter_datasets(target_project, max_items=max_datasets + 1))
+            except Exception as e:
+                out(f"Error listing datasets: {e}")
+                datasets = []
+            if not datasets:
+                out("No datasets found or access denied.")
+                return
+
+            # Fetch dataset info and table summaries for every shown dataset concurrently
+            shown = datasets[:max_datasets]
+            has_more = len(datasets) > max_datasets
+            info_futures = [self._executor.submit(self.get_dataset_info, d, target_project) for d in shown]
+            table_futures = [self._executor.submit(self.list_tables_bulk, d, target_project) for d in shown]
+
+            if has_more:
+                out(f"Found more than {max_datasets} datasets, showing the first {max_datasets}:")
+            else:
+                out(f"Found {len(datasets)} datasets:")
+            for i, dataset_id in enumerate(shown):
+                out(f"\n[{i+1}/{len(shown)}] {dataset_id}")
+                out("-" * 40)
+
+                dataset_info = info_futures[i].result()
+                if dataset_info:
+                    out(f"Description: {dataset_info['description'] or 'No description'}")
+                    out(f"Location: {dataset_info['location']}")
+
+                    # List tables with basic info (one metadata query per dataset)
+                    tables = table_futures[i].result()
+                    if tables:
+                        out(f"Tables ({len(tables)}):")
+                        for table_id, table_info in list(tables.items())[:5]:  # Show first 5 tables
                             rows = table_info['num_rows']
                             size_mb = table_info['num_bytes'] / (1024 * 1024) if table_info['num_bytes'] else 0
-                            print(f"  • {table_id}: {rows:,} rows ({size_mb:.1f} MB)")
+                            out(f"  • {table_id}: {rows:,} rows ({size_mb:.1f} MB)")
+
+                        if len(tables) > 5:
+                            out(f"  ... and {len(tables) - 5} more tables")
+                    else:
+                        out("No tables found in this dataset")
+
+            if has_more:
+                out("\n... and more datasets")
+                out(f"Use explore_dataset() to examine specific datasets in detail")
+        finally:
+            sys.stdout.write(buf.getvalue())
+
+    @staticmethod
+    def _info_schema_view(project: str, region: str, view: str) -> str:
+        """Fully quoted identifier of a regional INFORMATION_SCHEMA view."""
+        return f"`{project}.region-{region.lower()}.INFORMATION_SCHEMA.{view}`"
 
-                    if len(tables) > 5:
-                        print(f"  ... and {len(tables) - 5} more tables")
-                else:
-                    print("No tables found in this dataset")
+    def _datasets_by_region(self, project: str, region: Optional[str]) -> Dict[str, List[str]]:
+        """
+        Group a project's dataset IDs by location, using the single cached dataset listing.
 
-        if len(datasets) > max_datasets:
-            print(f"\n... and {len(datasets) - max_datasets} more datasets")
-            print(f"Use explore_dataset() to examine specific datasets in detail")
+        With region given, only that location is returned (even if no listed dataset is in it).
+        """
+        by_region: Dict[str, List[str]] = {region.lower(): []} if region else {}
+        for dataset_id, location in self._list_datasets_cached(project).items():
+            if location and (not region or location in by_region):
+                by_region.setdefault(location, []).append(dataset_id)
+        return by_region
+
+    def _search_all_regions(self, search_region, project: str, region: Optional[str],
+                            fallback=None) -> List[Dict[str, Any]]:
+        """
+        Run search_region(region) for every dataset location concurrently and merge the results.
 
-    def search_datasets(self, search_term: str, project_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        The regional INFORMATION_SCHEMA views need project-level permissions. When
+        a region's query is denied and a fallback is given, that region is searched
+        with fallback(dataset_ids) instead, which only needs access to the datasets.
+        """
+        from google.api_core.exceptions import Forbidden
+
+        by_region = self._datasets_by_region(project, region)
+        futures = {r: self._executor.submit(search_region, r) for r in by_region}
+        results = []
+        for r, future in futures.items():
+            try:
+                results.extend(future.result())
+            except Forbidden:
+                if fallback is None:
+                    raise
+                results.extend(fallback(by_region[r]))
+        return results
+
+    def search_datasets(self, search_term: str, project_id: Optional[str] = None,
+                        region: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         Search for datasets containing a specific term in their ID or description.
 
+        Matching runs server-side in one parameterized query per region over the
+        project's regional INFORMATION_SCHEMA.SCHEMATA and SCHEMATA_OPTIONS views.
+        By default every location that holds a dataset is searched; locations come
+        from the cached dataset listing, so no per-dataset calls are made. Without
+        project-level access to those views, a region falls back to matching each
+        dataset's metadata.
+
         Args:
             search_term (str): Term to search for
             project_id (str, optional): Project ID. Uses default if None.
+            region (str, optional): Only search datasets in this location (e.g. "us",
+                "eu", "us-central1"). Datasets elsewhere are then not returned.
 
         Returns:
             List[Dict[str, Any]]: List of matching datasets with their info
         """
         target_project = project_id or self.project_id
-        search_term_lower = search_term.lower()
-        matching_datasets = []
-
-        datasets = self.list_datasets(target_project)
-        for dataset_id in datasets:
-            dataset_info = self.get_dataset_info(dataset_id, target_project)
-            if dataset_info:
-                # Search in dataset ID and description
-                if (search_term_lower in dataset_id.lower() or
-                    (dataset_info['description'] and search_term_lower in dataset_info['description'].lower())):
-                    matching_datasets.append(dataset_info)
+        from google.cloud import bigquery
+
+        job_config = bigquery.QueryJobConfig(
+            query_parameters=[bigquery.ScalarQueryParameter("term", "STRING", search_term.lower())]
+        )
+
+        def search_region(region_name: str) -> List[Dict[str, Any]]:
+            schemata = self._info_schema_view(target_project, region_name, "SCHEMATA")
+            schemata_options = self._info_schema_view(target_project, region_name, "SCHEMATA_OPTIONS")
+            sql = f"""
+                SELECT
+                  s.schema_name,
+                  s.location,
+                  s.creation_time,
+                  s.last_modified_time,
+                  JSON_VALUE(o.option_value) AS description
+                FROM {schemata} AS s
+                LEFT JOIN {schemata_options} AS o
+                  ON o.schema_name = s.schema_name AND o.option_name = 'description'
+                WHERE STRPOS(LOWER(s.schema_name), @term) > 0
+                   OR STRPOS(LOWER(JSON_VALUE(o.option_value)), @term) > 0
+            """
+            rows = self.client.query(sql, job_config=job_config).result()
+            return [
+                {
+                    'dataset_id': row['schema_name'],
+                    'project': target_project,
+                    'description': row['description'],
+                    'created': row['creation_time'],
+                    'modified': row['last_modified_time'],
+                    'location': row['location'],
+                }
+                for row in rows
+            ]
+
+        def search_dataset_info(dataset_ids: List[str]) -> List[Dict[str, Any]]:
+            # Dataset-scoped access: match the (cached) per-dataset metadata locally
+            term = search_term.lower()
+            infos = self._executor.map(lambda d: self.get_dataset_info(d, target_project), dataset_ids)
+            return [
+                info for info in infos
+                if info and (term in info['dataset_id'].lower()
+                             or term in (info['description'] or '').lower())
+            ]
 
-        return matching_datasets
+        try:
+            results = self._search_all_regions(search_region, target_project, region,
+                                               fallback=search_dataset_info)
+        except Exception as e:
+            print(f"Error searching datasets: {e}")
+            return []
+        return sorted(results, key=operator.itemgetter('dataset_id'))
 
-    def search_tables(self, search_term: str, project_id: Optional[str] = None) -> List[Dict[str, Any]]:
+    def search_tables(self, search_term: str, project_id: Optional[str] = None,
+                      region: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         Search for tables containing a specific term across all datasets.
 
+        Matching and metadata both come from one parameterized query per region
+        over the project's regional INFORMATION_SCHEMA views (TABLES, TABLE_STORAGE
+        and COLUMNS), so no per-table get_table() calls are made. By default every
+        location that holds a dataset is searched. Schema types use GoogleSQL
+        names (e.g. INT64 rather than INTEGER).
+
+        Without project-level access to those views, a region falls back to listing
+        each dataset's tables and fetching the matches with get_table_info() (whose
+        schema types use legacy names such as INTEGER).
+
         Args:
             search_term (str): Term to search for in table names
             project_id (str, optional): Project ID. Uses default if None.
+            region (str, optional): Only search datasets in this location (e.g. "us",
+                "eu", "us-central1"). Tables elsewhere are then not returned.
 
         Returns:
             List[Dict[str, Any]]: List of matching tables with their info
         """
         target_project = project_id or self.project_id
-        search_term_lower = search_term.lower()
-        matching_tables = []
-
-        datasets = self.list_datasets(target_project)
-        for dataset_id in datasets:
-            tables = self.list_tables(dataset_id, target_project)
-            for table_id in tables:
-                if search_term_lower in table_id.lower():
-                    table_info = self.get_table_info(dataset_id, table_id, target_project)
-                    if table_info:
-                        table_info['full_table_id'] = f"{target_project}.{dataset_id}.{table_id}"
-                        matching_tables.append(table_info)
-
-        return matching_tables
+        from google.cloud import bigquery
+
+        job_config = bigquery.QueryJobConfig(
+            query_parameters=[bigquery.ScalarQueryParameter("term", "STRING", search_term.lower())]
+        )
+
+        def search_region(region_name: str) -> List[Dict[str, Any]]:
+            tables = self._info_schema_view(target_project, region_name, "TABLES")
+            columns = self._info_schema_view(target_project, region_name, "COLUMNS")
+            table_storage = self._info_schema_view(target_project, region_name, "TABLE_STORAGE")
+            sql = f"""
+                WITH matches AS (
+                  SELECT table_schema, table_name, table_type, creation_time
+                  FROM {tables}
+                  WHERE STRPOS(LOWER(table_name), @term) > 0
+                ),
+                schemas AS (
+                  SELECT
+                    c.table_schema,
+                    c.table_name,
+                    ARRAY_AGG(STRUCT(
+                      c.column_name AS name,
+                      c.data_type AS type,
+                      CASE
+                        WHEN STARTS_WITH(c.data_type, 'ARRAY<') THEN 'REPEATED'
+                        WHEN c.is_nullable = 'YES' THEN 'NULLABLE'
+                        ELSE 'REQUIRED'
+                      END AS mode
+                    ) ORDER BY c.ordinal_position) AS schema
+                  FROM {columns} AS c
+                  JOIN matches AS m
+                    ON c.table_schema = m.table_schema AND c.table_name = m.table_name
+                  GROUP BY c.table_schema, c.table_name
+                )
+                SELECT
+                  m.table_schema,
+                  m.table_name,
+                  m.table_type,
+                  m.creation_time AS created,
+                  s.storage_last_modified_time AS modified,
+                  s.total_rows AS num_rows,
+                  s.total_logical_bytes AS num_bytes,
+                  c.schema
+                FROM matches AS m
+                LEFT JOIN {table_storage} AS s
+                  ON s.table_schema = m.table_schema AND s.table_name = m.table_name
+                LEFT JOIN schemas AS c
+                  ON c.table_schema = m.table_schema AND c.table_name = m.table_name
+            """
+            rows = self.client.query(sql, job_config=job_config).result()
+            return [
+                {
+                    'table_id': row['table_name'],
+                    'dataset_id': row['table_schema'],
+                    'project': target_project,
+                    'table_type': row['table_type'],
+                    'num_rows': row['num_rows'],
+                    'num_bytes': row['num_bytes'],
+                    'created': row['created'],
+                    'modified': row['modified'],
+                    'schema': [dict(field) for field in row['schema'] or []],
+                    'full_table_id': f"{target_project}.{row['table_schema']}.{row['table_name']}",
+                }
+                for row in rows
+            ]
+
+        def search_table_info(dataset_ids: List[str]) -> List[Dict[str, Any]]:
+            # Dataset-scoped access: list each dataset's tables and fetch matches' metadata
+            term = search_term.lower()
+            names = self._executor.map(lambda d: (d, self.list_tables(d, target_project)), dataset_ids)
+            matches = [(d, t) for d, tables in names for t in tables if term in t.lower()]
+            infos = self._executor.map(lambda m: self.get_table_info(m[0], m[1], target_project), matches)
+            return [
+                {**info, 'full_table_id': f"{target_project}.{info['dataset_id']}.{info['table_id']}"}
+                for info in infos if info
+            ]
 
+        try:
+            results = self._search_all_regions(search_region, target_project, region,
+                                               fallback=search_table_info)
+        except Exception as e:
+            print(f"Error searching tables: {e}")
+            return []
+        return sorted(results, key=operator.itemgetter('dataset_id', 'table_id'))
 
 # Example usage and convenience functions
 def create_agent(project_id: Optional[str] = None) -> BigQueryAgent:
@@ -319,30 +789,8 @@ def create_agent(project_id: Optional[str] = None) -> BigQueryAgent:
     return BigQueryAgent(project_id)
 
 
-def create_emergency_crisis_bigquery_agent(project_id: str, dataset_name: str, model: str = "gemini-2.5-flash") -> Agent:
-    """
-    Create an ADK Agent configured for FEMA BigQuery dataset analysis.
-
-    Args:
-        project_id: Google Cloud project ID
-        dataset_name: Full dataset name (e.g., "project.dataset")
-        model: Gemini model to use
-
-    Returns:
-        Configured ADK Agent for BigQuery operations
-    """
-    # Setup BigQuery tools
-    credentials, _ = google.auth.default()
-    bq_credentials = BigQueryCredentialsConfig(credentials=credentials)
-    bq_tool_cfg = BigQueryToolConfig(write_mode=WriteMode.BLOCKED)  # Read-only
-
-    bq_tools = BigQueryToolset(
-        credentials_config=bq_credentials,
-        bigquery_tool_config=bq_tool_cfg
-    )
-
-    # Database schema for USDA food data
-    DB_SCHEMA = """
+# Database schema for the FEMA emergency dataset (JSON, embedded in the agent prompt)
+DB_SCHEMA = """
 [{
   "table_name": "fema_nssf",
   "fields": [{
@@ -374,7 +822,8 @@ def create_emergency_crisis_bigquery_agent(project_id: str, dataset_name: str, m
     "column_name": "zip",
     "data_type": "INT64"
   },
-  "column_name": "shelter_status_code",
+  {
+    "column_name": "shelter_status_code",
     "data_type": "STRING"
   },
   {
@@ -497,19 +946,46 @@ def create_emergency_crisis_bigquery_agent(project_id: str, dataset_name: str, m
     "data_type": "STRING"
   }]
   }]
-    """
+"""
 
-    # Agent instructions
-    PROJECT_ID = "qwiklabs-gcp-01-2a76b8f0c7a6" # @param {type:"string"}
-    DATASET_NAME = "B2AgentsForImpact"
-    instructions = f"""
+# Agent instructions; {dataset} is the fully qualified "project.dataset" name
+_FEMA_AGENT_INSTRUCTIONS_TMPL = """
 The dataset you have access to contains information from FEMA e.g. fema_nssf, hospital_gengeral_info, Food_Banks and other tables
 have info about emergency shelters, pet capacity, etc.
-Only query the dataset `{PROJECT_ID}.{DATASET_NAME}`.
-Fully qualify every table as `{PROJECT_ID}.{DATASET_NAME}.<table>`. Use all available tables and fields to make jugdement.
+Only query the dataset `{dataset}`.
+Fully qualify every table as `{dataset}.<table>`. Use all available tables and fields to make jugdement.
 Never perform DDL/DML; SELECT-only. Return the SQL you ran along with a concise answer.
-Here is the database schema, please study it {DB_SCHEMA}
+Here is the database schema, please study it {schema}
+    """
+
+
+@functools.lru_cache(maxsize=8)
+def _render_fema_instructions(dataset_name: str) -> str:
+    """Format the instruction template (with the embedded schema) once per dataset."""
+    return _FEMA_AGENT_INSTRUCTIONS_TMPL.format(dataset=dataset_name, schema=DB_SCHEMA)
+
+
+def create_emergency_crisis_bigquery_agent(project_id: str, dataset_name: str, model: str = "gemini-2.5-flash") -> Agent:
     """
+    Create an ADK Agent configured for FEMA BigQuery dataset analysis.
+
+    Args:
+        project_id: Google Cloud project ID
+        dataset_name: Full dataset name (e.g., "project.dataset")
+        model: Gemini model to use
+
+    Returns:
+        Configured ADK Agent for BigQuery operations. A new Agent is built on every
+        call; the toolset and rendered instructions are cached.
+    """
+    from google.adk.agents import Agent
+    from utils.credentials import get_bigquery_toolset
+
+    # Setup BigQuery tools (read-only, backed by the cached default credentials)
+    bq_tools = get_bigquery_toolset(project_id)
+
+    # Agent instructions
+    instructions = _render_fema_instructions(dataset_name)
 
     # Create and return the agent
     return Agent(
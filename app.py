@@ -4,15 +4,14 @@ ADK Web App Configuration
 Configures agents for local web server using 'adk web'.
 """
 
+import logging
 import os
-import sys
-
-# Add current directory to path
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 # Import agents
 from agents.fema2_agent import create_emergency_crisis_bigquery_agent
 
+logger = logging.getLogger(__name__)
+
 # Get project info from environment
 project_id = os.environ.get('GOOGLE_CLOUD_PROJECT', 'qwiklabs-gcp-01-2a76b8f0c7a6')
 dataset_name = f"{project_id}.B2AgentsForImpact"
@@ -23,6 +22,6 @@ agent = create_emergency_crisis_bigquery_agent(
     dataset_name=dataset_name
 )
 
-print(f"✅ Agent configured for ADK web server: {agent.name}")
-print(f"📊 Project: {project_id}")
-print(f"🗄️  Dataset: {dataset_name}")
+logger.debug("✅ Agent configured for ADK web server: %s", agent.name)
+logger.debug("📊 Project: %s", project_id)
+logger.debug("🗄️  Dataset: %s", dataset_name)
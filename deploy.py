@@ -4,159 +4,247 @@ Simple Agent Deployment Script
 Discovers agents in agents/ directory and deploys them to Google Agent Engine.
 """
 
+from __future__ import annotations
+
+import functools
 import os
+import re
 import sys
-import subprocess
-import importlib.util
+import importlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from uuid import uuid4
+from typing import TYPE_CHECKING, Dict, Final, Optional, Sequence, Tuple, Any
 import argparse
+import logging
+
+from utils.project_id import get_project_id
 
-# Add current directory to path
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+# vertexai / google.adk are imported where used so --help and --list stay fast
+if TYPE_CHECKING:
+    from google.adk.agents import Agent
 
-# Core imports
-import google.auth
-import vertexai
-from vertexai import agent_engines
-from google.adk.agents import Agent
+logger = logging.getLogger(__name__)
+
+# Packages installed into every Agent Engine deployment (shared, never rebuilt per call)
+DEFAULT_REQUIREMENTS: Final[Tuple[str, ...]] = (
+    "google-cloud-aiplatform[adk,agent_engines]>=1.70.0",
+    "google-auth>=2.0.0",
+    "google-genai>=1.10.0",
+    "google-cloud-bigquery>=3.0.0",
+    "pandas>=1.5.0",
+    "cachetools>=5.0.0",
+)
 
 
 def get_project_info():
-    """Get Google Cloud project information."""
-    try:
-        result = subprocess.run(
-            ['gcloud', 'config', 'get-value', 'project'],
-            capture_output=True, text=True
-        )
-        if result.returncode == 0 and result.stdout.strip() != "(unset)":
-            return result.stdout.strip()
-        else:
-            return os.environ.get('GOOGLE_CLOUD_PROJECT')
-    except:
-        return os.environ.get('GOOGLE_CLOUD_PROJECT')
+    """Get Google Cloud project information (env, gcloud config file, then ADC; no subprocess).
+
+    Shares the cached ADC lookup with check_auth(), so credentials are resolved once.
+    """
+    return get_project_id()
 
 
+@functools.lru_cache(maxsize=1)
 def check_auth():
-    """Check if user is authenticated."""
+    """Check if Application Default Credentials are available (checked once per process)."""
     try:
-        result = subprocess.run(
-            ['gcloud', 'auth', 'list', '--filter=status:ACTIVE', '--format=value(account)'],
-            capture_output=True, text=True
-        )
-        if result.returncode == 0 and result.stdout.strip():
-            print(f"✅ Authenticated as: {result.stdout.strip()}")
-            return True
-        else:
-            print("❌ Not authenticated. Run 'python setup_auth.py' first")
-            return False
-    except:
-        print("❌ gcloud not found. Install Google Cloud SDK")
+        from google.auth.exceptions import DefaultCredentialsError
+        from utils.credentials import get_default_credentials
+    except ImportError:
+        logger.error("❌ google-auth not installed. Run 'pip install -r requirements.txt'")
         return False
 
+    try:
+        credentials, _ = get_default_credentials()
+    except DefaultCredentialsError:
+        logger.error("❌ Not authenticated. Run 'python setup_auth.py' first")
+        return False
+
+    account = (getattr(credentials, "service_account_email", None)
+               or getattr(credentials, "account", None)
+               or "Application Default Credentials")
+    logger.info("✅ Authenticated as: %s", account)
+    return True
+
+
+def _load_agent_module(agent_file: Path):
+    """Load one agent file and return (module_name, module), or (module_name, None) on error."""
+    module_name = agent_file.stem
+    try:
+        logger.info("📦 Loading %s...", module_name)
+        # Regular package import: reuses agents/__pycache__ and the parent package's finder
+        return module_name, importlib.import_module(f"agents.{module_name}")
+    except Exception as e:
+        logger.error("❌ Error loading %s: %s", module_name, e)
+    return module_name, None
+
+
+def _format_agent_list(agents) -> str:
+    """Format discovered agents as one indented block, so listings are a single log record."""
+    return "".join(f"\n  - {name} (from {info['file']})" for name, info in agents.items())
+
+
+def _agent_factories(module):
+    """
+    Get (name, function) pairs for the agent creation functions in a module.
+
+    Uses the module's AGENT_FACTORIES list when it defines one; otherwise scans
+    the module namespace for callables named 'create_*_agent'.
+    """
+    namespace = vars(module)
+    factories = namespace.get('AGENT_FACTORIES')
+    if factories is not None:
+        return [(func.__name__, func) for func in factories]
+    return [
+        (attr_name, func) for attr_name, func in namespace.items()
+        if attr_name.startswith('create_') and attr_name.endswith('_agent') and callable(func)
+    ]
+
 
 def discover_agents():
     """Discover agents in the agents/ directory."""
-    print("🔍 Discovering agents...")
+    logger.info("🔍 Discovering agents...")
     
     agents_dir = Path("agents")
     if not agents_dir.exists():
-        print("❌ agents/ directory not found")
+        logger.error("❌ agents/ directory not found")
         return {}
     
-    # Add agents directory to path
-    sys.path.insert(0, str(agents_dir.absolute()))
-    
     # Find and load all agent files
-    agent_files = list(agents_dir.glob("*.py"))
-    agent_files = [f for f in agent_files if f.name not in ["__init__.py", "registry.py"]]
+    with os.scandir(agents_dir) as entries:
+        agent_files = sorted(
+            Path(entry.path) for entry in entries
+            if entry.name.endswith(".py") and entry.name not in ("__init__.py", "registry.py")
+        )
     
-    print(f"Found {len(agent_files)} agent files:")
-    for file in agent_files:
-        print(f"  - {file.name}")
+    logger.info("Found %d agent files:%s", len(agent_files),
+                "".join(f"\n  - {file.name}" for file in agent_files))
     
     agents = {}
     
-    # Load each agent module and look for agent creation functions
+    # Load agent modules one at a time: imports hold the GIL and the import lock,
+    # and concurrent imports of packages with import cycles can fail
     for agent_file in agent_files:
-        module_name = agent_file.stem
-        try:
-            print(f"📦 Loading {module_name}...")
-            spec = importlib.util.spec_from_file_location(module_name, agent_file)
-            if spec and spec.loader:
-                module = importlib.util.module_from_spec(spec)
-                sys.modules[module_name] = module
-                spec.loader.exec_module(module)
-                
-                # Look for agent creation functions (functions that start with 'create_' and end with '_agent')
-                for attr_name in dir(module):
-                    if attr_name.startswith('create_') and attr_name.endswith('_agent'):
-                        func = getattr(module, attr_name)
-                        if callable(func):
-                            agent_name = attr_name.replace('create_', '').replace('_agent', '')
-                            agents[agent_name] = {
-                                'name': agent_name,
-                                'create_function': func,
-                                'module': module_name,
-                                'file': agent_file.name
-                            }
-                            print(f"  ✅ Found agent creator: {attr_name}")
-                            
-        except Exception as e:
-            print(f"❌ Error loading {module_name}: {e}")
+        module_name, module = _load_agent_module(agent_file)
+        if module is None:
+            continue
+        for attr_name, func in _agent_factories(module):
+            agent_name = attr_name.replace('create_', '').replace('_agent', '')
+            agents[agent_name] = {
+                'name': agent_name,
+                'create_function': func,
+                'module': module_name,
+                'file': agent_file.name
+            }
+            logger.info("  ✅ Found agent creator: %s", attr_name)
     
-    print(f"\n✅ Discovered {len(agents)} agents:")
-    for name, info in agents.items():
-        print(f"  - {name} (from {info['file']})")
+    logger.info("\n✅ Discovered %d agents:%s", len(agents), _format_agent_list(agents))
     
     return agents
 
 
+# The only Agent-level memoization: the factories in agents/ build a fresh Agent
+# per call (caching just the toolset/instructions), and this cache owns the
+# lifetime of the instances deploy.py wraps in AdkApp. They are never parented,
+# so don't hand them to another agent's sub_agents.
+@functools.lru_cache(maxsize=32)
+def _build_agent(create_function, project_id: str, dataset_name: str):
+    """Call an agent factory once per (factory, project, dataset); repeat discoveries reuse the agent."""
+    return create_function(project_id=project_id, dataset_name=dataset_name)
+
+
 def create_agent_instance(agent_info, project_id: str):
     """Create an agent instance."""
-    print(f"🤖 Creating {agent_info['name']} agent...")
+    logger.info("🤖 Creating %s agent...", agent_info['name'])
     
     try:
         # Create the agent with project info
-        agent = agent_info['create_function'](
-            project_id=project_id,
-            dataset_name=f"{project_id}.B2AgentsForImpact"
+        agent = _build_agent(
+            agent_info['create_function'],
+            project_id,
+            f"{project_id}.B2AgentsForImpact"
         )
-        print(f"✅ Created agent: {agent.name}")
+        logger.info("✅ Created agent: %s", agent.name)
         return agent
     except Exception as e:
-        print(f"❌ Error creating agent: {e}")
+        logger.error("❌ Error creating %s agent: %s", agent_info['name'], e)
         return None
 
 
-def deploy_agent(agent: Agent, agent_info, project_id: str):
+# pip comment syntax: '#' at line start or after whitespace (so URL fragments survive)
+_REQUIREMENT_COMMENT = re.compile(r"(^|\s)#.*$")
+
+
+def read_requirements(path: str) -> Tuple[str, ...]:
+    """Read a pip requirements file once, dropping blank lines and full-line/inline comments."""
+    with open(path) as f:
+        lines = (_REQUIREMENT_COMMENT.sub("", line).strip() for line in f)
+        return tuple(line for line in lines if line)
+
+
+@functools.lru_cache(maxsize=None)
+def init_vertex_ai(project_id: str, staging_bucket: str, location: str = "us-central1"):
+    """Initialize Vertex AI and the environment variables google-genai reads (once per settings)."""
+    import vertexai
+
+    vertexai.init(project=project_id, location=location, staging_bucket=staging_bucket)
+    for key, value in (("GOOGLE_GENAI_USE_VERTEXAI", "true"),
+                       ("GOOGLE_CLOUD_PROJECT", project_id),
+                       ("GOOGLE_CLOUD_LOCATION", location)):
+        if os.environ.get(key) != value:
+            os.environ[key] = value
+
+
+def deploy_to_agent_engine(agent: Agent, display_name: str,
+                           requirements: Optional[Sequence[str]] = None,
+                           gcs_dir_name: Optional[str] = None):
+    """
+    Wrap an agent in an AdkApp and create it on Google Agent Engine.
+
+    Args:
+        agent: ADK agent to deploy
+        display_name: Agent Engine display name
+        requirements: pip requirements for the deployment. Uses DEFAULT_REQUIREMENTS if None.
+        gcs_dir_name: Staging-bucket directory for the uploaded artifacts. Defaults to a
+            unique "agent_engine/<display_name>-<id>" so concurrent deploys sharing a
+            bucket don't overwrite each other's pickle/requirements/dependencies.
+
+    Returns:
+        The created remote Agent Engine app
+    """
+    from vertexai import agent_engines
+
+    if gcs_dir_name is None:
+        gcs_dir_name = f"agent_engine/{display_name}-{uuid4().hex[:8]}"
+    app = agent_engines.AdkApp(
+        agent=agent,
+        enable_tracing=True,
+    )
+    return agent_engines.create(
+        display_name=display_name,
+        agent_engine=app,
+        requirements=list(DEFAULT_REQUIREMENTS if requirements is None else requirements),
+        gcs_dir_name=gcs_dir_name,
+    )
+
+
+def deploy_agent(agent: Agent, agent_info, project_id: str,
+                 display_name: Optional[str] = None,
+                 requirements: Optional[Sequence[str]] = None):
     """Deploy an agent to Google Agent Engine."""
     agent_name = agent_info['name']
-    print(f"\n🚀 Deploying {agent_name} agent...")
+    logger.info("\n🚀 Deploying %s agent...", agent_name)
     
     try:
-        # Create AdkApp
-        app = agent_engines.AdkApp(
-            agent=agent,
-            enable_tracing=True,
-        )
-        
-        # Deploy
-        deployment_name = agent_name.replace('_', '-')
-        remote_app = agent_engines.create(
-            display_name=deployment_name,
-            agent_engine=app,
-            requirements=[
-                "google-cloud-aiplatform[adk,agent_engines]>=1.70.0",
-                "google-auth>=2.0.0",
-                "google-genai>=0.8.0",
-                "google-cloud-bigquery>=3.0.0",
-                "pandas>=1.5.0"
-            ]
+        remote_app = deploy_to_agent_engine(
+            agent,
+            display_name or agent_name.replace('_', '-'),
+            requirements
         )
         
-        print(f"✅ Deployment successful!")
-        print(f"📍 Resource: {remote_app.resource_name}")
+        logger.info("✅ %s: deployment successful!", agent_name)
+        logger.info("📍 %s resource: %s", agent_name, remote_app.resource_name)
         
         # Extract engine ID for console URL
         parts = remote_app.resource_name.split('/')
@@ -166,17 +254,28 @@ def deploy_agent(agent: Agent, agent_info, project_id: str):
                 f"https://console.cloud.google.com/vertex-ai/agent-builder/"
                 f"engines/{engine_id}/overview?project={project_id}"
             )
-            print(f"🔗 Console: {console_url}")
+            logger.info("🔗 %s console: %s", agent_name, console_url)
         
         return remote_app
         
     except Exception as e:
-        print(f"❌ Deployment failed: {e}")
-        print("💡 Troubleshooting:")
-        print("  - Ensure Vertex AI API is enabled: gcloud services enable aiplatform.googleapis.com")
-        print("  - Check you have Vertex AI Administrator role")
-        print("  - Verify billing is enabled")
+        logger.error("❌ %s: deployment failed: %s", agent_name, e)
+        logger.info(
+            "💡 Troubleshooting:\n"
+            "  - Ensure Vertex AI API is enabled: gcloud services enable aiplatform.googleapis.com\n"
+            "  - Check you have Vertex AI Administrator role\n"
+            "  - Verify billing is enabled"
+        )
+        return None
+
+
+def _create_and_deploy(agent_info, project_id: str,
+                       requirements: Optional[Sequence[str]] = None):
+    """Create an agent instance and deploy it; returns the remote app or None."""
+    agent = create_agent_instance(agent_info, project_id)
+    if agent is None:
         return None
+    return deploy_agent(agent, agent_info, project_id, requirements=requirements)
 
 
 def main():
@@ -185,77 +284,88 @@ def main():
     parser.add_argument('--agent', '-a', help="Deploy specific agent by name")
     parser.add_argument('--list', '-l', action='store_true', help="List available agents")
     parser.add_argument('--check-auth', action='store_true', help="Check authentication")
+    parser.add_argument('--display-name', help="Agent Engine display name (with --agent)")
+    parser.add_argument('--requirements-file', help="pip requirements file for the deployment")
     
     args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
     
-    print("🚀 Agent Deployment System")
-    print("=" * 40)
+    logger.info("🚀 Agent Deployment System")
+    logger.info("=" * 40)
     
-    # Check authentication
-    if args.check_auth or not check_auth():
-        return 1 if not check_auth() else 0
+    # Both lookups are cached in-process and share one ADC resolution, so run them
+    # in sequence (concurrent callers would both miss and resolve ADC twice)
+    authed = check_auth()
+    if args.check_auth:
+        return 0 if authed else 1
+    if not authed:
+        return 1
     
     # Get project
     project_id = get_project_info()
     if not project_id:
-        print("❌ Could not determine project ID")
-        print("💡 Run 'python setup_auth.py' to configure")
+        logger.error("❌ Could not determine project ID")
+        logger.info("💡 Run 'python setup_auth.py' to configure")
         return 1
     
-    print(f"✅ Project: {project_id}")
+    logger.info("✅ Project: %s", project_id)
     
-    # Initialize Vertex AI
-    try:
-        staging_bucket = f"gs://agent-staging-{project_id[:8]}"
-        vertexai.init(project=project_id, location="us-central1", staging_bucket=staging_bucket)
-        os.environ["GOOGLE_GENAI_USE_VERTEXAI"] = "true"
-        os.environ["GOOGLE_CLOUD_PROJECT"] = project_id
-        os.environ["GOOGLE_CLOUD_LOCATION"] = "us-central1"
-        print(f"✅ Vertex AI initialized (staging: {staging_bucket})")
-    except Exception as e:
-        print(f"❌ Error initializing Vertex AI: {e}")
-        return 1
+    requirements = read_requirements(args.requirements_file) if args.requirements_file else None
     
     # Discover agents
     agents = discover_agents()
     if not agents:
-        print("❌ No agents found")
+        logger.error("❌ No agents found")
         return 1
     
     # List only
     if args.list:
-        print(f"\n📋 Available agents ({len(agents)}):")
-        for name, info in agents.items():
-            print(f"  - {name} (from {info['file']})")
+        logger.info("\n📋 Available agents (%d):%s", len(agents), _format_agent_list(agents))
         return 0
     
+    # Initialize Vertex AI (only needed when deploying)
+    try:
+        staging_bucket = f"gs://agent-staging-{project_id[:8]}"
+        init_vertex_ai(project_id, staging_bucket)
+        logger.info("✅ Vertex AI initialized (staging: %s)", staging_bucket)
+    except Exception as e:
+        logger.error("❌ Error initializing Vertex AI: %s", e)
+        return 1
+    
     # Deploy specific agent
     if args.agent:
         if args.agent not in agents:
-            print(f"❌ Agent '{args.agent}' not found")
-            print(f"Available: {', '.join(agents.keys())}")
+            logger.error("❌ Agent '%s' not found", args.agent)
+            logger.info("Available: %s", ', '.join(agents.keys()))
             return 1
         
         agent_info = agents[args.agent]
         agent = create_agent_instance(agent_info, project_id)
         if agent:
-            result = deploy_agent(agent, agent_info, project_id)
+            result = deploy_agent(agent, agent_info, project_id,
+                                  display_name=args.display_name,
+                                  requirements=requirements)
             return 0 if result else 1
         return 1
     
-    # Deploy all agents
-    print(f"\n🚀 Deploying {len(agents)} agents...")
-    deployed = 0
+    # Deploy all agents (each agent_engines.create is an independent, long remote operation)
+    logger.info("\n🚀 Deploying %d agents...", len(agents))
     
-    for name, agent_info in agents.items():
-        print(f"\n[{deployed + 1}/{len(agents)}] {agent_info.display_name}")
-        agent = create_agent_instance(agent_info, project_id)
-        if agent:
-            result = deploy_agent(agent, agent_info, project_id)
-            if result:
+    deployed = 0
+    with ThreadPoolExecutor(max_workers=min(16, len(agents))) as executor:
+        futures = {
+            executor.submit(_create_and_deploy, agent_info, project_id, requirements): agent_info['name']
+            for agent_info in agents.values()
+        }
+        # Report progress as each deployment finishes
+        for finished, future in enumerate(as_completed(futures), start=1):
+            ok = future.result() is not None
+            if ok:
                 deployed += 1
+            logger.info("\n[%d/%d] %s %s", finished, len(agents), futures[future],
+                        "✅ deployed" if ok else "❌ failed")
     
-    print(f"\n🎉 Deployed {deployed}/{len(agents)} agents successfully!")
+    logger.info("\n🎉 Deployed %d/%d agents successfully!", deployed, len(agents))
     return 0 if deployed > 0 else 1
 
 
@@ -264,8 +374,8 @@ if __name__ == "__main__":
         exit_code = main()
         sys.exit(exit_code)
     except KeyboardInterrupt:
-        print("\n❌ Cancelled by user")
+        logger.error("\n❌ Cancelled by user")
         sys.exit(1)
     except Exception as e:
-        print(f"\n❌ Error: {e}")
+        logger.error("\n❌ Error: %s", e)
         sys.exit(1)
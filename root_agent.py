@@ -1,10 +1,7 @@
 # root_agent.py
-import os
+import logging
 import sys
 
-# Add current directory to path
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-
 from google.adk.agents import Agent
 from google.genai import types
 from google.adk.tools import agent_tool
@@ -13,29 +10,23 @@ from google.adk.tools import agent_tool
 from utils.geocode_tool import geocode_tool
 from agents.data_agent import create_data_agent
 from agents.insights_agent import create_insights_agent
+from utils.credentials import get_bigquery_toolset
+from utils.project_id import get_project_id
+
+logger = logging.getLogger(__name__)
 
 # Get project configuration
-project_id = os.environ.get('GOOGLE_CLOUD_PROJECT')
-if not project_id:
-    # Try to get from gcloud
-    import subprocess
-    try:
-        result = subprocess.run(
-            ['gcloud', 'config', 'get-value', 'project'],
-            capture_output=True, text=True
-        )
-        if result.returncode == 0 and result.stdout.strip() != "(unset)":
-            project_id = result.stdout.strip()
-    except:
-        pass
+project_id = get_project_id()
 
 if not project_id:
     project_id = "your-project-id"
-    print("⚠️  Could not determine project ID. Using placeholder.")
+    logger.warning("⚠️  Could not determine project ID. Using placeholder.")
 
-# Create the sub-agents
+# Create the sub-agents around a single shared BigQuery toolset
 dataset_name = f"{project_id}.emergency_resources"
-data_agent = create_data_agent(project_id, dataset_name)
+bq_tools = get_bigquery_toolset(project_id)
+
+data_agent = create_data_agent(project_id, dataset_name, bq_tools=bq_tools)
 insights_agent = create_insights_agent()
 
 
@@ -44,10 +35,14 @@ MODEL = "gemini-2.5-flash"
 agent_generation = types.GenerateContentConfig(
     temperature=0.6,
     top_p=0.9,
-    max_output_tokens=32768,
+    # On gemini-2.5 models thinking tokens count against max_output_tokens, so the
+    # thinking budget is capped explicitly and the limit keeps headroom above it
+    # for the visible summary + 3-5 item list (and tool-call turns).
+    max_output_tokens=8192,
+    thinking_config=types.ThinkingConfig(thinking_budget=1024),
 )
 
-ROOT_AGENT_INSTRUCTIONS = """
+ROOT_AGENT_INSTRUCTIONS = sys.intern("""
 You are the Root Agent for the **Emergency Resource Finder & Crisis Navigator** system.
 
 Your mission:
@@ -105,7 +100,7 @@ You can also suggest practical next steps:
 - “Here are 3 nearby hospitals with open ERs and available beds.”
 
 Be concise, professional, and reassuring.
-"""
+""")
 
 root_agent = Agent(
     name="erfcn_root_agent",
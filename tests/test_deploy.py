@@ -0,0 +1,90 @@
+"""Tests for the deploy-all path of deploy.py (no Google Cloud access needed)."""
+
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+import deploy
+
+
+def _agents():
+    """Two discovered agents, shaped like discover_agents() output."""
+    return {
+        name: {
+            'name': name,
+            'create_function': mock.Mock(name=f"create_{name}_agent"),
+            'module': f"{name}_agent",
+            'file': f"{name}_agent.py",
+        }
+        for name in ("data", "insights")
+    }
+
+
+class DeployAllTest(unittest.TestCase):
+    """Runs main() with no --agent/--list flag, i.e. the deploy-all loop."""
+
+    def _run_main(self, create_and_deploy):
+        with mock.patch.object(deploy, "check_auth", return_value=True), \
+             mock.patch.object(deploy, "get_project_info", return_value="test-project"), \
+             mock.patch.object(deploy, "discover_agents", return_value=_agents()), \
+             mock.patch.object(deploy, "init_vertex_ai"), \
+             mock.patch.object(deploy, "_create_and_deploy", side_effect=create_and_deploy) as patched, \
+             mock.patch.object(sys, "argv", ["deploy.py"]), \
+             self.assertLogs(deploy.logger, "INFO") as logs:
+            exit_code = deploy.main()
+        return exit_code, patched, "\n".join(logs.output)
+
+    def test_deploys_every_agent(self):
+        exit_code, patched, output = self._run_main(lambda agent_info, project_id, requirements: object())
+
+        self.assertEqual(exit_code, 0)
+        self.assertEqual(sorted(c.args[0]['name'] for c in patched.call_args_list), ["data", "insights"])
+        self.assertTrue(all(c.args[1] == "test-project" for c in patched.call_args_list))
+        self.assertIn("[2/2]", output)
+        self.assertIn("Deployed 2/2 agents successfully", output)
+
+    def test_counts_failed_deployments(self):
+        exit_code, _, output = self._run_main(
+            lambda agent_info, project_id, requirements: object() if agent_info['name'] == "data" else None
+        )
+
+        self.assertEqual(exit_code, 0)
+        self.assertIn("insights ❌ failed", output)
+        self.assertIn("Deployed 1/2 agents successfully", output)
+
+    def test_fails_when_nothing_deploys(self):
+        exit_code, _, output = self._run_main(lambda agent_info, project_id, requirements: None)
+
+        self.assertEqual(exit_code, 1)
+        self.assertIn("Deployed 0/2 agents successfully", output)
+
+
+class ReadRequirementsTest(unittest.TestCase):
+    """read_requirements() must hand agent_engines.create bare requirement specifiers."""
+
+    def _read(self, text):
+        with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as f:
+            f.write(text)
+        self.addCleanup(os.remove, f.name)
+        return deploy.read_requirements(f.name)
+
+    def test_strips_full_line_and_inline_comments(self):
+        requirements = self._read(
+            "# Core\n"
+            "google-auth>=2.0.0\n"
+            "\n"
+            "google-cloud-bigquery-storage>=2.0.0  # Optional: faster query result downloads\n"
+        )
+
+        self.assertEqual(requirements, ("google-auth>=2.0.0", "google-cloud-bigquery-storage>=2.0.0"))
+
+    def test_keeps_url_fragments(self):
+        requirements = self._read("pkg @ https://example.com/pkg.zip#sha256=abc\n")
+
+        self.assertEqual(requirements, ("pkg @ https://example.com/pkg.zip#sha256=abc",))
+
+
+if __name__ == "__main__":
+    unittest.main()
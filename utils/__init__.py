@@ -0,0 +1 @@
+# Shared Google Cloud helpers and tools
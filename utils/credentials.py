@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+"""
+Shared Google Cloud Credentials
+Caches Application Default Credentials and the BigQuery toolsets built from them.
+"""
+
+from __future__ import annotations
+
+import functools
+from typing import TYPE_CHECKING, Optional, Tuple
+
+import google.auth
+from google.auth.credentials import Credentials
+
+# google.adk is imported in get_bigquery_toolset so auth-only callers stay light
+if TYPE_CHECKING:
+    from google.adk.tools.bigquery import BigQueryToolset
+    from google.adk.tools.bigquery.config import WriteMode
+
+
+@functools.lru_cache(maxsize=1)
+def get_default_credentials() -> Tuple[Credentials, Optional[str]]:
+    """
+    Get Application Default Credentials, resolved once per process.
+
+    Returns:
+        Tuple of (credentials, project_id) as returned by google.auth.default()
+    """
+    return google.auth.default()
+
+
+@functools.lru_cache(maxsize=8)
+def get_bigquery_toolset(project_id: Optional[str] = None,
+                         write_mode: Optional[WriteMode] = None,
+                         credentials: Optional[Credentials] = None) -> BigQueryToolset:
+    """
+    Get a shared BigQuery toolset for ADK agents.
+
+    Args:
+        project_id: Google Cloud project the toolset is used with (part of the cache key)
+        write_mode: BigQuery write mode. Read-only (BLOCKED) if None.
+        credentials: Credentials to use instead of the cached default credentials
+
+    Returns:
+        BigQueryToolset backed by the given or cached default credentials
+    """
+    from google.adk.tools.bigquery import BigQueryCredentialsConfig, BigQueryToolset
+    from google.adk.tools.bigquery.config import BigQueryToolConfig, WriteMode
+
+    if write_mode is None:
+        write_mode = WriteMode.BLOCKED
+    if credentials is None:
+        credentials, _ = get_default_credentials()
+    bq_credentials = BigQueryCredentialsConfig(credentials=credentials)
+    bq_tool_cfg = BigQueryToolConfig(write_mode=write_mode)
+
+    return BigQueryToolset(
+        credentials_config=bq_credentials,
+        bigquery_tool_config=bq_tool_cfg
+    )
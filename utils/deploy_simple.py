@@ -1,36 +1,28 @@
 #!/usr/bin/env python3
 """
 Simple BigQuery Agent Deployment to Vertex AI Agent Engine
+Thin wrapper around the shared deployment helpers in deploy.py.
+
+Run from the repository root as a module so `deploy` and `utils` resolve:
+
+    python -m utils.deploy_simple
+
+(`python utils/deploy_simple.py` only works after `pip install -e .`.)
 """
 
-import os
+import logging
 import sys
 
-# Add current directory to path
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+# Google Cloud / ADK SDKs are imported inside the functions that use them
+from deploy import DEFAULT_REQUIREMENTS, deploy_to_agent_engine, init_vertex_ai
+from utils.project_id import get_project_id
 
-# Core imports
-import google.auth
-from google.cloud import bigquery, storage
-from google.adk.agents import Agent
-from google.adk.tools.bigquery import BigQueryCredentialsConfig, BigQueryToolset
-from google.adk.tools.bigquery.config import BigQueryToolConfig, WriteMode
-from vertexai import agent_engines
-import vertexai
+logger = logging.getLogger(__name__)
 
 
 def get_project_info():
-    """Get project information."""
-    try:
-        import subprocess
-        result = subprocess.run(['gcloud', 'config', 'get-value', 'project'], 
-                              capture_output=True, text=True)
-        if result.returncode == 0 and result.stdout.strip() != "(unset)":
-            project_id = result.stdout.strip()
-        else:
-            project_id = os.environ.get('GOOGLE_CLOUD_PROJECT')
-    except:
-        project_id = os.environ.get('GOOGLE_CLOUD_PROJECT')
+    """Get project information (env, gcloud config file, then cached ADC; no subprocess)."""
+    project_id = get_project_id()
     
     if not project_id:
         raise ValueError("Could not determine project ID. Set GOOGLE_CLOUD_PROJECT or run 'gcloud config set project PROJECT_ID'")
@@ -40,18 +32,11 @@ def get_project_info():
 
 def create_bigquery_agent(project_id: str, dataset_name: str):
     """Create the BigQuery agent for USDA food data."""
+    from google.adk.agents import Agent
+    from utils.credentials import get_bigquery_toolset
     
-    # Setup authentication
-    credentials, _ = google.auth.default()
-    
-    # Setup BigQuery tools
-    bq_credentials = BigQueryCredentialsConfig(credentials=credentials)
-    bq_tool_cfg = BigQueryToolConfig(write_mode=WriteMode.BLOCKED)  # Read-only
-    
-    bq_tools = BigQueryToolset(
-        credentials_config=bq_credentials,
-        bigquery_tool_config=bq_tool_cfg
-    )
+    # Setup BigQuery tools (read-only, backed by the cached default credentials)
+    bq_tools = get_bigquery_toolset(project_id)
     
     # Agent instructions with database schema
     instructions = f"""
@@ -86,61 +71,36 @@ def create_bigquery_agent(project_id: str, dataset_name: str):
 def deploy_agent():
     """Deploy the BigQuery agent to Vertex AI Agent Engine."""
     
-    print("🚀 Deploying USDA BigQuery Agent to Vertex AI Agent Engine...")
+    logger.info("🚀 Deploying USDA BigQuery Agent to Vertex AI Agent Engine...")
     
     # Get project info
     project_id = get_project_info()
-    print(f"✓ Project ID: {project_id}")
-    
-    # Initialize Vertex AI
-    vertexai.init(project=project_id, location="us-central1", staging_bucket="gs://agent-engine-staging-ec50015b68224a39baab")
-    print("✓ Vertex AI initialized")
+    logger.info("✓ Project ID: %s", project_id)
     
-    # Set environment variables
-    os.environ["GOOGLE_GENAI_USE_VERTEXAI"] = "true"
-    os.environ["GOOGLE_CLOUD_PROJECT"] = project_id
-    os.environ["GOOGLE_CLOUD_LOCATION"] = "us-central1"
+    # Initialize Vertex AI and environment variables
+    init_vertex_ai(project_id, staging_bucket="gs://agent-engine-staging-ec50015b68224a39baab")
+    logger.info("✓ Vertex AI initialized")
     
     # Create dataset name
     dataset_name = f"{project_id}.B2AgentsForImpact"
-    print(f"✓ Dataset: {dataset_name}")
+    logger.info("✓ Dataset: %s", dataset_name)
     
     # Create the agent
-    print("📊 Creating BigQuery agent...")
+    logger.info("📊 Creating BigQuery agent...")
     agent = create_bigquery_agent(project_id, dataset_name)
-    print(f"✓ Agent created: {agent.name}")
-    
-    # Prepare for deployment
-    requirements = [
-        "google-cloud-aiplatform[adk,agent_engines]>=1.70.0",
-        "google-auth>=2.0.0",
-        "google-genai>=0.8.0",
-        "google-cloud-bigquery>=3.0.0",
-        "pandas>=1.5.0"
-    ]
+    logger.info("✓ Agent created: %s", agent.name)
     
-    print("📦 Deployment requirements:")
-    for req in requirements:
-        print(f"  - {req}")
-    
-    # Create AdkApp
-    print("\n🔧 Creating AdkApp wrapper...")
-    app = agent_engines.AdkApp(
-        agent=agent,
-        enable_tracing=True,
-    )
+    logger.info("📦 Deployment requirements:")
+    for req in DEFAULT_REQUIREMENTS:
+        logger.info("  - %s", req)
     
     # Deploy to Agent Engine
-    print("\n🚀 Deploying to Vertex AI Agent Engine...")
+    logger.info("\n🚀 Deploying to Vertex AI Agent Engine...")
     try:
-        remote_app = agent_engines.create(
-            display_name="usda-bigquery-food-agent",
-            agent_engine=app,
-            requirements=requirements
-        )
+        remote_app = deploy_to_agent_engine(agent, "usda-bigquery-food-agent")
         
-        print("\n✅ Deployment successful!")
-        print(f"📍 Resource Name: {remote_app.resource_name}")
+        logger.info("\n✅ Deployment successful!")
+        logger.info("📍 Resource Name: %s", remote_app.resource_name)
         
         # Parse resource name for useful info
         parts = remote_app.resource_name.split('/')
@@ -149,36 +109,37 @@ def deploy_agent():
             location = parts[3] 
             engine_id = parts[5]
             
-            print(f"\n📋 Deployment Details:")
-            print(f"  Project: {project_id}")
-            print(f"  Location: {location}")
-            print(f"  Engine ID: {engine_id}")
+            logger.info("\n📋 Deployment Details:")
+            logger.info("  Project: %s", project_id)
+            logger.info("  Location: %s", location)
+            logger.info("  Engine ID: %s", engine_id)
             
             console_url = f"https://console.cloud.google.com/vertex-ai/agent-builder/engines/{engine_id}/overview?project={project_id}"
-            print(f"\n🔗 Access your agent:")
-            print(f"  {console_url}")
+            logger.info("\n🔗 Access your agent:")
+            logger.info("  %s", console_url)
         
-        print(f"\n💡 Test your agent with queries like:")
-        print(f"  - 'List all tables in the dataset'")
-        print(f"  - 'How many rows are in the food table?'")
-        print(f"  - 'Show top 10 foods highest in protein'")
+        logger.info("\n💡 Test your agent with queries like:")
+        logger.info("  - 'List all tables in the dataset'")
+        logger.info("  - 'How many rows are in the food table?'")
+        logger.info("  - 'Show top 10 foods highest in protein'")
         
         return remote_app
         
     except Exception as e:
-        print(f"\n❌ Deployment failed: {e}")
-        print(f"\n🔍 Troubleshooting:")
-        print(f"  1. Ensure Vertex AI API is enabled: gcloud services enable aiplatform.googleapis.com")
-        print(f"  2. Check permissions: you need Vertex AI Administrator role")
-        print(f"  3. Verify billing is enabled for the project")
-        print(f"  4. Make sure the dataset {dataset_name} exists and is accessible")
+        logger.error("\n❌ Deployment failed: %s", e)
+        logger.info("\n🔍 Troubleshooting:")
+        logger.info("  1. Ensure Vertex AI API is enabled: gcloud services enable aiplatform.googleapis.com")
+        logger.info("  2. Check permissions: you need Vertex AI Administrator role")
+        logger.info("  3. Verify billing is enabled for the project")
+        logger.info("  4. Make sure the dataset %s exists and is accessible", dataset_name)
         raise
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
     try:
         deploy_agent()
-        print("\n🎉 Deployment completed successfully!")
+        logger.info("\n🎉 Deployment completed successfully!")
     except Exception as e:
-        print(f"\n💥 Deployment failed: {e}")
+        logger.error("\n💥 Deployment failed: %s", e)
         sys.exit(1)
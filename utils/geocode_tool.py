@@ -5,15 +5,16 @@ Provides geocoding functionality for converting addresses to coordinates.
 """
 
 import os
-import requests
 import inspect
 from typing import Dict, Any
 
+from utils.http_session import get_http_session
+
 # Try to import FunctionTool; older builds may not have it
 try:
     from google.adk.tools import FunctionTool
     HAVE_FUNCTION_TOOL = True
-except Exception:
+except ImportError:
     HAVE_FUNCTION_TOOL = False
 
 
@@ -51,7 +52,7 @@ def _geocode_address(address: str, api_key: str = None) -> Dict[str, Any]:
         }
 
     try:
-        response = requests.get(
+        response = get_http_session().get(
             "https://maps.googleapis.com/maps/api/geocode/json",
             params={"address": address, "key": api_key},
             timeout=10,
@@ -114,7 +115,7 @@ def _reverse_geocode(lat: float, lon: float, api_key: str = None) -> Dict[str, A
         }
 
     try:
-        response = requests.get(
+        response = get_http_session().get(
             "https://maps.googleapis.com/maps/api/geocode/json",
             params={"latlng": f"{lat},{lon}", "key": api_key},
             timeout=10,
@@ -4,37 +4,31 @@ Google Cloud Utilities and Authentication
 Handles authentication, project setup, and common utilities for Google Cloud services.
 """
 
-import os
+from __future__ import annotations
+
 import asyncio
-import time
-import uuid
-from typing import Any, Dict, List, Optional
+import base64
+import logging
+import os
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Optional
 from uuid import uuid4
 
-# Google Cloud and Authentication
-import google.auth
-from google.cloud import storage, bigquery
-from google.auth.credentials import Credentials
-
-# Vertex AI
-import vertexai
-
-# Google GenAI
-from google import genai
+# Google GenAI types back the module-level generation configs below
 from google.genai import types
 
-# ADK Imports
-from google.adk.agents import Agent
-from google.adk.runners import Runner
-from google.adk.sessions import InMemorySessionService
-from google.adk.tools.bigquery import BigQueryCredentialsConfig, BigQueryToolset
-from google.adk.tools.bigquery.config import BigQueryToolConfig, WriteMode
-from google.adk.tools import google_search, agent_tool
+from utils.project_id import get_project_id
 
-# Other utilities
-import pandas as pd
-import requests
-from bs4 import BeautifulSoup
+logger = logging.getLogger(__name__)
+
+# Heavier SDKs (google.cloud.*, vertexai, google.adk) are imported inside the
+# functions that use them so importing this module stays cheap.
+if TYPE_CHECKING:
+    from google import genai
+    from google.auth.credentials import Credentials
+    from google.cloud import bigquery, storage
+    from google.adk.tools.bigquery import BigQueryToolset
 
 
 class GoogleCloudConfig:
@@ -48,36 +42,47 @@ class GoogleCloudConfig:
         self.dataset_name = f"{self.project_id}.B2AgentsForImpact"
         
     def _get_project_id(self) -> str:
-        """Get project ID from gcloud config or environment."""
-        try:
-            # Try to get from gcloud config
-            import subprocess
-            result = subprocess.run(['gcloud', 'config', 'get-value', 'project'], 
-                                  capture_output=True, text=True)
-            if result.returncode == 0 and result.stdout.strip() != "(unset)":
-                return result.stdout.strip()
-        except:
-            pass
-        
-        # Fallback to environment variable
-        project_id = os.environ.get('GOOGLE_CLOUD_PROJECT')
+        """Get project ID from environment or gcloud config."""
+        project_id = get_project_id()
         if not project_id:
             raise ValueError("Could not determine project ID. Set GOOGLE_CLOUD_PROJECT environment variable.")
         return project_id
 
 
+@functools.lru_cache(maxsize=8)
+def _bq_client(project_id: str, credentials: Optional[Credentials] = None) -> bigquery.Client:
+    """Get a shared BigQuery client for a (project, credentials) pair."""
+    from google.cloud import bigquery
+
+    return bigquery.Client(project=project_id, credentials=credentials)
+
+
+@functools.lru_cache(maxsize=1)
+def _gcs_client() -> storage.Client:
+    """Get a shared Cloud Storage client for the default project."""
+    from google.cloud import storage
+
+    return storage.Client()
+
+
 def authenticate_google_cloud(config: GoogleCloudConfig) -> Credentials:
     """Authenticate with Google Cloud using Application Default Credentials."""
-    credentials, _ = google.auth.default()
+    from google.cloud import bigquery
+    from utils.credentials import get_default_credentials
+
+    credentials, _ = get_default_credentials()
     config.credentials = credentials
     
-    # Test BigQuery authentication
-    bq_client = bigquery.Client(project=config.project_id, credentials=credentials)
+    # Test BigQuery authentication with a dry run: one RTT, no slot scheduling, not billed
+    bq_client = _bq_client(config.project_id, credentials)
     try:
-        bq_client.query("SELECT 1").result()
-        print("✓ BigQuery authentication successful")
+        bq_client.query(
+            "SELECT 1",
+            job_config=bigquery.QueryJobConfig(dry_run=True, use_query_cache=False),
+        )
+        logger.debug("✓ BigQuery authentication successful")
     except Exception as e:
-        print(f"✗ BigQuery authentication failed: {e}")
+        logger.error("✗ BigQuery authentication failed: %s", e)
         raise
     
     return credentials
@@ -85,6 +90,8 @@ def authenticate_google_cloud(config: GoogleCloudConfig) -> Credentials:
 
 def setup_vertex_ai(config: GoogleCloudConfig, staging_bucket: Optional[str] = None):
     """Initialize Vertex AI with project configuration."""
+    import vertexai
+
     if staging_bucket:
         config.staging_bucket = staging_bucket
         
@@ -99,18 +106,40 @@ def setup_vertex_ai(config: GoogleCloudConfig, staging_bucket: Optional[str] = N
     os.environ["GOOGLE_CLOUD_PROJECT"] = config.project_id
     os.environ["GOOGLE_CLOUD_LOCATION"] = config.location
     
-    print(f"✓ Vertex AI initialized for project: {config.project_id}")
+    logger.debug("✓ Vertex AI initialized for project: %s", config.project_id)
+
+
+@functools.lru_cache(maxsize=8)
+def get_genai_client(project_id: str, location: str) -> genai.Client:
+    """Return a shared Vertex AI GenAI client for a project/location pair."""
+    from google import genai
+
+    return genai.Client(vertexai=True, project=project_id, location=location)
+
+
+@functools.lru_cache(maxsize=8)
+def _probe_gemini(project_id: str, location: str) -> str:
+    """Send one request to Gemini; only successful probes are cached."""
+    client = get_genai_client(project_id, location)
+    resp = client.models.generate_content(model="gemini-2.5-flash", contents="hello")
+    return resp.text
 
 
 def test_gemini_connection(config: GoogleCloudConfig) -> bool:
-    """Test connection to Gemini API."""
+    """
+    Test connection to Gemini API.
+
+    The probe runs at most once per (project, location) per process.
+    Set SKIP_GEMINI_PROBE=1 to skip it entirely.
+    """
+    if os.environ.get("SKIP_GEMINI_PROBE"):
+        return True
     try:
-        client = genai.Client(vertexai=True, project=config.project_id, location=config.location)
-        resp = client.models.generate_content(model="gemini-2.5-flash", contents="hello")
-        print(f"✓ Gemini API test successful: {resp.text[:50]}...")
+        text = _probe_gemini(config.project_id, config.location)
+        logger.debug("✓ Gemini API test successful: %s...", text[:50])
         return True
     except Exception as e:
-        print(f"✗ Gemini API test failed: {e}")
+        logger.error("✗ Gemini API test failed: %s", e)
         return False
 
 
@@ -125,27 +154,15 @@ def create_unique_bucket(location: str = "US", prefix: str = "nbkt") -> storage.
     Returns:
         The created google.cloud.storage.bucket.Bucket object.
     """
-    client = storage.Client()
+    client = _gcs_client()
     # Bucket name rules: 3–63 chars, lowercase letters/digits/hyphens, must start/end with letter or digit.
-    # Use a UUID4 hex (32 chars) trimmed to keep name short while being vanishingly collision-prone.
-    unique_suffix = uuid4().hex[:20]  # 20 hex chars = 80 bits of entropy
+    # A full UUID4 in base32 is 26 chars; at 122 random bits a collision is not worth a retry path.
+    unique_suffix = base64.b32encode(uuid4().bytes).decode().rstrip("=").lower()
     bucket_name = f"{prefix}-{unique_suffix}"
 
-    # Very unlikely collision; still, try once more if it happens.
-    try:
-        bucket = client.bucket(bucket_name)
-        bucket = client.create_bucket(bucket, location=location)
-        print(f"✓ Created bucket: {bucket.name} (location: {bucket.location}) in project: {client.project}")
-        return bucket
-    except Exception as e:
-        if "You already own this bucket" in str(e) or "Conflict" in str(e) or "already exists" in str(e):
-            # Regenerate once and retry
-            bucket_name = f"{prefix}-{uuid4().hex[:20]}"
-            bucket = client.bucket(bucket_name)
-            bucket = client.create_bucket(bucket, location=location)
-            print(f"✓ Created bucket on retry: {bucket.name} (location: {bucket.location}) in project: {client.project}")
-            return bucket
-        raise
+    bucket = client.create_bucket(client.bucket(bucket_name), location=location)
+    logger.debug("✓ Created bucket: %s (location: %s) in project: %s", bucket.name, bucket.location, client.project)
+    return bucket
 
 
 def setup_bigquery_tools(config: GoogleCloudConfig) -> BigQueryToolset:
@@ -153,15 +170,56 @@ def setup_bigquery_tools(config: GoogleCloudConfig) -> BigQueryToolset:
     if not config.credentials:
         raise ValueError("Credentials not initialized. Call authenticate_google_cloud first.")
     
-    bq_credentials = BigQueryCredentialsConfig(credentials=config.credentials)
-    bq_tool_cfg = BigQueryToolConfig(write_mode=WriteMode.BLOCKED)  # Read-only by default
+    from utils.credentials import get_bigquery_toolset
     
-    bq_tools = BigQueryToolset(
-        credentials_config=bq_credentials,
-        bigquery_tool_config=bq_tool_cfg
-    )
+    # Read-only by default; backed by the config's own credentials, not ADC
+    bq_tools = get_bigquery_toolset(config.project_id, credentials=config.credentials)
     
-    print("✓ BigQuery tools configured")
+    logger.debug("✓ BigQuery tools configured")
+    return bq_tools
+
+
+def _init_config(project_id: Optional[str], location: str) -> GoogleCloudConfig:
+    """Build the config for initialize_google_cloud(_async) (resolves the project)."""
+    logger.debug("🚀 Initializing Google Cloud services...")
+    
+    config = GoogleCloudConfig(project_id, location)
+    logger.debug("✓ Project ID: %s", config.project_id)
+    logger.debug("✓ Location: %s", config.location)
+    return config
+
+
+def _authenticate_and_stage(config: GoogleCloudConfig, create_staging_bucket: bool) -> Optional[str]:
+    """
+    Authenticate (overlapping the Gemini probe), then create the staging bucket.
+
+    The bucket is a side effect, so it is only created once auth succeeds.
+
+    Returns:
+        Staging bucket name, or None if not requested or creation failed
+    """
+    staging_bucket_name = None
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        auth_future = executor.submit(authenticate_google_cloud, config)
+        executor.submit(test_gemini_connection, config)
+        
+        # Authentication failures are fatal
+        auth_future.result()
+        
+        if create_staging_bucket:
+            try:
+                staging_bucket_name = create_unique_bucket(location="US", prefix="agent-engine-staging").name
+            except Exception as e:
+                logger.warning("⚠️  Could not create staging bucket: %s", e)
+    return staging_bucket_name
+
+
+def _finish_setup(config: GoogleCloudConfig, staging_bucket_name: Optional[str]) -> BigQueryToolset:
+    """Set up Vertex AI (needs the staging bucket name) and the BigQuery tools."""
+    setup_vertex_ai(config, staging_bucket_name)
+    bq_tools = setup_bigquery_tools(config)
+    
+    logger.debug("✅ Google Cloud initialization complete!")
     return bq_tools
 
 
@@ -174,35 +232,26 @@ def initialize_google_cloud(project_id: Optional[str] = None,
     Returns:
         Tuple of (config, bigquery_tools)
     """
-    print("🚀 Initializing Google Cloud services...")
-    
-    # Setup configuration
-    config = GoogleCloudConfig(project_id, location)
-    print(f"✓ Project ID: {config.project_id}")
-    print(f"✓ Location: {config.location}")
-    
-    # Authenticate
-    authenticate_google_cloud(config)
-    
-    # Create staging bucket if needed
-    staging_bucket_name = None
-    if create_staging_bucket:
-        try:
-            bucket = create_unique_bucket(location="US", prefix="agent-engine-staging")
-            staging_bucket_name = bucket.name
-        except Exception as e:
-            print(f"⚠️  Could not create staging bucket: {e}")
-    
-    # Setup Vertex AI
-    setup_vertex_ai(config, staging_bucket_name)
-    
-    # Test Gemini connection
-    test_gemini_connection(config)
+    config = _init_config(project_id, location)
+    staging_bucket_name = _authenticate_and_stage(config, create_staging_bucket)
+    return config, _finish_setup(config, staging_bucket_name)
+
+
+async def initialize_google_cloud_async(project_id: Optional[str] = None,
+                                      location: str = "us-central1",
+                                      create_staging_bucket: bool = True) -> tuple[GoogleCloudConfig, BigQueryToolset]:
+    """
+    Complete initialization of Google Cloud services without blocking the event loop.
     
-    # Setup BigQuery tools
-    bq_tools = setup_bigquery_tools(config)
+    Same steps as initialize_google_cloud(), for callers already running inside
+    asyncio (e.g. ADK's Runner). Blocking SDK calls run via asyncio.to_thread.
     
-    print("✅ Google Cloud initialization complete!")
+    Returns:
+        Tuple of (config, bigquery_tools)
+    """
+    config = await asyncio.to_thread(_init_config, project_id, location)
+    staging_bucket_name = await asyncio.to_thread(_authenticate_and_stage, config, create_staging_bucket)
+    bq_tools = await asyncio.to_thread(_finish_setup, config, staging_bucket_name)
     return config, bq_tools
 
 
@@ -216,16 +265,19 @@ DEFAULT_AGENT_CONFIG = types.GenerateContentConfig(
     max_output_tokens=32768,
 )
 
+# Safety settings for image generation (immutable, built once)
+IMAGE_SAFETY_SETTINGS = (
+    types.SafetySetting(category="HARM_CATEGORY_HATE_SPEECH", threshold="OFF"),
+    types.SafetySetting(category="HARM_CATEGORY_DANGEROUS_CONTENT", threshold="OFF"),
+    types.SafetySetting(category="HARM_CATEGORY_SEXUALLY_EXPLICIT", threshold="OFF"),
+    types.SafetySetting(category="HARM_CATEGORY_HARASSMENT", threshold="OFF"),
+)
+
 # Image generation config
 IMAGE_GENERATION_CONFIG = types.GenerateContentConfig(
     temperature=1.0,
     top_p=0.95,
     max_output_tokens=4096,
     response_modalities=["IMAGE"],
-    safety_settings=[
-        types.SafetySetting(category="HARM_CATEGORY_HATE_SPEECH", threshold="OFF"),
-        types.SafetySetting(category="HARM_CATEGORY_DANGEROUS_CONTENT", threshold="OFF"),
-        types.SafetySetting(category="HARM_CATEGORY_SEXUALLY_EXPLICIT", threshold="OFF"),
-        types.SafetySetting(category="HARM_CATEGORY_HARASSMENT", threshold="OFF"),
-    ],
+    safety_settings=list(IMAGE_SAFETY_SETTINGS),
 )
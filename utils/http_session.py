@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+"""
+Shared HTTP Session
+Pooled, retrying requests.Session for REST calls made by agents and tools.
+"""
+
+from __future__ import annotations
+
+import functools
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import requests
+
+
+@functools.lru_cache(maxsize=1)
+def get_http_session() -> requests.Session:
+    """
+    Return a shared HTTP session for REST calls made by agents and tools.
+
+    Use get_http_session().get(...) instead of requests.get(...) so
+    connections (and their TLS handshakes) are kept alive and reused.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=32,
+        max_retries=Retry(total=3, backoff_factor=0.3),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
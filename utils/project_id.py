@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+"""
+Google Cloud Project Discovery
+Resolves the active project ID without spawning gcloud.
+"""
+
+import configparser
+import functools
+import os
+from typing import Optional
+
+
+def _gcloud_config_dir() -> str:
+    """Get the gcloud configuration directory."""
+    return os.environ.get("CLOUDSDK_CONFIG") or os.path.expanduser("~/.config/gcloud")
+
+
+def _read_gcloud_config_project() -> Optional[str]:
+    """Read `[core] project` from the active gcloud configuration file."""
+    config_dir = _gcloud_config_dir()
+    active = os.environ.get("CLOUDSDK_ACTIVE_CONFIG_NAME")
+    if not active:
+        try:
+            with open(os.path.join(config_dir, "active_config")) as f:
+                active = f.read().strip()
+        except OSError:
+            active = None
+
+    parser = configparser.ConfigParser()
+    try:
+        parser.read(os.path.join(config_dir, "configurations", f"config_{active or 'default'}"))
+    except configparser.Error:
+        # Malformed config (e.g. no [core] header): fall through to ADC like a missing file
+        return None
+    return parser.get("core", "project", fallback=None) or None
+
+
+def _adc_project() -> Optional[str]:
+    """Get the project bound to Application Default Credentials (last resort)."""
+    try:
+        from google.auth.exceptions import DefaultCredentialsError
+        from utils.credentials import get_default_credentials
+    except ImportError:
+        return None
+
+    try:
+        _, project_id = get_default_credentials()
+    except DefaultCredentialsError:
+        return None
+    return project_id
+
+
+@functools.lru_cache(maxsize=1)
+def get_project_id() -> Optional[str]:
+    """
+    Get the Google Cloud project ID, resolved once per process.
+
+    Checks GOOGLE_CLOUD_PROJECT / CLOUDSDK_CORE_PROJECT, then the active gcloud
+    configuration file, and only then falls back to Application Default
+    Credentials; gcloud is never spawned.
+
+    Returns:
+        The project ID, or None if it could not be determined
+    """
+    return (
+        os.environ.get("GOOGLE_CLOUD_PROJECT")
+        or os.environ.get("CLOUDSDK_CORE_PROJECT")
+        or _read_gcloud_config_project()
+        or _adc_project()
+    )
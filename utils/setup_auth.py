@@ -4,9 +4,30 @@ Setup Google Cloud Authentication
 Prompts for credentials and sets up authentication for the correct account.
 """
 
+import functools
 import os
+import shutil
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
+
+# Upper bound (seconds) for non-interactive gcloud/bq queries, so a hung CLI can't block setup
+GCLOUD_TIMEOUT = 30
+
+
+@functools.lru_cache(maxsize=None)
+def _which(tool):
+    """Resolve a CLI tool on PATH once per process (falls back to the bare name)."""
+    return shutil.which(tool) or tool
+
+
+def _probe(cmd):
+    """Run a read-only CLI check; True if it exits 0 within GCLOUD_TIMEOUT."""
+    try:
+        subprocess.run(cmd, check=True, capture_output=True, timeout=GCLOUD_TIMEOUT)
+        return True
+    except (OSError, subprocess.SubprocessError):
+        return False
 
 
 def check_current_auth():
@@ -15,8 +36,8 @@ def check_current_auth():
     
     try:
         # Check current account
-        result = subprocess.run(['gcloud', 'auth', 'list', '--filter=status:ACTIVE', '--format=value(account)'], 
-                              capture_output=True, text=True)
+        result = subprocess.run([_which('gcloud'), 'auth', 'list', '--filter=status:ACTIVE', '--format=value(account)'], 
+                              capture_output=True, text=True, timeout=GCLOUD_TIMEOUT)
         if result.returncode == 0 and result.stdout.strip():
             current_account = result.stdout.strip()
             print(f"✓ Currently authenticated as: {current_account}")
@@ -24,7 +45,7 @@ def check_current_auth():
         else:
             print("❌ No active authentication found")
             return None
-    except Exception as e:
+    except (OSError, subprocess.SubprocessError) as e:
         print(f"❌ Error checking authentication: {e}")
         return None
 
@@ -32,8 +53,8 @@ def check_current_auth():
 def check_current_project():
     """Check current project."""
     try:
-        result = subprocess.run(['gcloud', 'config', 'get-value', 'project'], 
-                              capture_output=True, text=True)
+        result = subprocess.run([_which('gcloud'), 'config', 'get-value', 'project'], 
+                              capture_output=True, text=True, timeout=GCLOUD_TIMEOUT)
         if result.returncode == 0 and result.stdout.strip() != "(unset)":
             project = result.stdout.strip()
             print(f"✓ Current project: {project}")
@@ -41,7 +62,7 @@ def check_current_project():
         else:
             print("❌ No project set")
             return None
-    except Exception as e:
+    except (OSError, subprocess.SubprocessError) as e:
         print(f"❌ Error checking project: {e}")
         return None
 
@@ -53,7 +74,7 @@ def authenticate_new_account():
     # Login with gcloud
     print("Opening browser for Google Cloud authentication...")
     try:
-        result = subprocess.run(['gcloud', 'auth', 'login'], check=True)
+        result = subprocess.run([_which('gcloud'), 'auth', 'login'], check=True)
         print("✅ Authentication successful!")
     except subprocess.CalledProcessError as e:
         print(f"❌ Authentication failed: {e}")
@@ -62,7 +83,7 @@ def authenticate_new_account():
     # Set up application default credentials
     print("\nSetting up Application Default Credentials...")
     try:
-        result = subprocess.run(['gcloud', 'auth', 'application-default', 'login'], check=True)
+        result = subprocess.run([_which('gcloud'), 'auth', 'application-default', 'login'], check=True)
         print("✅ Application Default Credentials set!")
     except subprocess.CalledProcessError as e:
         print(f"❌ ADC setup failed: {e}")
@@ -77,8 +98,8 @@ def select_project():
     
     # List available projects
     try:
-        result = subprocess.run(['gcloud', 'projects', 'list', '--format=value(projectId)'], 
-                              capture_output=True, text=True)
+        result = subprocess.run([_which('gcloud'), 'projects', 'list', '--format=value(projectId)'], 
+                              capture_output=True, text=True, timeout=GCLOUD_TIMEOUT)
         if result.returncode == 0:
             projects = [p.strip() for p in result.stdout.strip().split('\n') if p.strip()]
             if projects:
@@ -109,7 +130,7 @@ def select_project():
                 selected_project = input("No projects found. Enter project ID: ").strip()
         else:
             selected_project = input("Enter project ID: ").strip()
-    except Exception as e:
+    except (OSError, subprocess.SubprocessError) as e:
         print(f"Error listing projects: {e}")
         selected_project = input("Enter project ID: ").strip()
     
@@ -119,7 +140,7 @@ def select_project():
     
     # Set the project
     try:
-        subprocess.run(['gcloud', 'config', 'set', 'project', selected_project], check=True)
+        subprocess.run([_which('gcloud'), 'config', 'set', 'project', selected_project], check=True)
         print(f"✅ Project set to: {selected_project}")
         return selected_project
     except subprocess.CalledProcessError as e:
@@ -138,13 +159,14 @@ def enable_required_apis(project_id):
         'cloudbuild.googleapis.com'
     ]
     
-    for api in required_apis:
-        print(f"Enabling {api}...")
-        try:
-            subprocess.run(['gcloud', 'services', 'enable', api], check=True)
-            print(f"✅ {api} enabled")
-        except subprocess.CalledProcessError as e:
-            print(f"⚠️  Failed to enable {api}: {e}")
+    # gcloud enables any number of services in one request/operation
+    print(f"Enabling {', '.join(required_apis)}...")
+    try:
+        subprocess.run([_which('gcloud'), 'services', 'enable', *required_apis,
+                        f'--project={project_id}'], check=True)
+        print(f"✅ {len(required_apis)} APIs enabled")
+    except subprocess.CalledProcessError as e:
+        print(f"⚠️  Failed to enable APIs: {e}")
     
     print("✅ API enablement completed")
 
@@ -163,21 +185,21 @@ def verify_setup():
     if not current_project:
         return False
     
-    # Test BigQuery access
-    print("Testing BigQuery access...")
-    try:
-        subprocess.run(['bq', 'ls', '--max_results=1'], check=True, capture_output=True)
+    # Test BigQuery and Vertex AI access concurrently (independent read-only calls)
+    print("Testing BigQuery and Vertex AI access...")
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        bq_future = executor.submit(_probe, [_which('bq'), 'ls', '--max_results=1'])
+        ai_future = executor.submit(_probe, [_which('gcloud'), 'ai', 'models', 'list',
+                                             '--region=us-central1', '--limit=1'])
+    
+    if bq_future.result():
         print("✅ BigQuery access verified")
-    except subprocess.CalledProcessError:
+    else:
         print("⚠️  BigQuery access test failed (this might be normal if no datasets exist)")
     
-    # Test Vertex AI access
-    print("Testing Vertex AI access...")
-    try:
-        result = subprocess.run(['gcloud', 'ai', 'models', 'list', '--region=us-central1', '--limit=1'], 
-                              check=True, capture_output=True)
+    if ai_future.result():
         print("✅ Vertex AI access verified")
-    except subprocess.CalledProcessError:
+    else:
         print("⚠️  Vertex AI access test failed")
     
     return True
@@ -188,6 +210,10 @@ def main():
     print("🚀 Google Cloud Authentication Setup")
     print("=" * 50)
     
+    if shutil.which('gcloud') is None:
+        print("❌ gcloud not found on PATH. Install the Google Cloud SDK first: https://cloud.google.com/sdk/docs/install")
+        return 1
+    
     # Check current status
     current_account = check_current_auth()
     current_project = check_current_project()
@@ -229,7 +255,7 @@ def main():
         print("\n✅ Authentication setup completed successfully!")
         print(f"Account: {check_current_auth()}")
         print(f"Project: {check_current_project()}")
-        print("\n🚀 You can now run: python deploy_simple.py")
+        print("\n🚀 You can now run: python -m utils.deploy_simple")
         return 0
     else:
         print("\n❌ Setup verification failed")